@@ -106,9 +106,7 @@ def main():
         model_reporters={
             "mean_fitness": lambda m: m.compute_mean_fitness(),
             "mean_expression": lambda m: (
-                sum(ind.mean_expression() for ind in m.individuals) / len(m.individuals)
-                if m.individuals
-                else 0.0
+                float(m.compute_mean_expression().mean()) if m.individuals else 0.0
             ),
         },
         individual_reporters={
@@ -19,7 +19,10 @@ class SimulationModel(ABC):
 
     def __init__(self, seed: int | None = None):
         self._generation: int = 0
-        self._rng: np.random.Generator = np.random.default_rng(seed)
+        # Generator built on first use of rng: models that never draw (e.g.
+        # networks that are built but not stepped) skip the bit-generator setup
+        self._seed: int | None = seed
+        self._rng: np.random.Generator | None = None
         self._running: bool = True
 
     @property
@@ -29,7 +32,9 @@ class SimulationModel(ABC):
 
     @property
     def rng(self) -> np.random.Generator:
-        """Reproducible random number generator."""
+        """Reproducible random number generator (seeded on first access)."""
+        if self._rng is None:
+            self._rng = np.random.default_rng(self._seed)
         return self._rng
 
     @property
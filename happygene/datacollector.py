@@ -1,11 +1,183 @@
 """DataCollector for 3-tier data collection (model, individual, gene level)."""
-from typing import Any, Callable, Dict, List
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from happygene.model import GeneNetwork
 
 
+def _reporter_attribute(reporter: Callable) -> Optional[str]:
+    """Return the attribute an ``operator.attrgetter("name")`` reporter reads.
+
+    Any other reporter (lambdas included) returns None and is called once
+    per object.
+    """
+    if type(reporter) is attrgetter:
+        args = reporter.__reduce__()[1]
+        if len(args) == 1 and "." not in args[0]:
+            return args[0]
+    return None
+
+
+class _ColumnStore:
+    """Column-oriented row storage backed by geometrically grown NumPy arrays.
+
+    Each column is one preallocated array; appending rows writes into the
+    next free slots and doubles capacity when full (amortized O(1) per row).
+    Numeric columns keep a numeric dtype (promoted as needed, e.g. int ->
+    float); anything else is stored in an object column.
+
+    Columns may come and go between calls. Rows without a value read as
+    missing (NaN), which may widen the stored dtype; each column also
+    tracks the dtype of its real values and the row spans that hold them, so
+    a retained window without gaps is reported in that dtype and a column
+    with no value in the window is left out, as a DataFrame built from the
+    retained rows alone would be.
+
+    Parameters
+    ----------
+    max_rows : int or None
+        Retain only the most recent max_rows rows. None = unlimited.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self, max_rows: Optional[int] = None):
+        self._max_rows = max_rows
+        self._columns: Dict[str, np.ndarray] = {}
+        # Per column: dtype of the supplied values and [begin, end) row spans
+        # that hold them (absolute row indices, shifted on compaction)
+        self._value_dtypes: Dict[str, np.dtype] = {}
+        self._spans: Dict[str, List[List[int]]] = {}
+        self._capacity = 0
+        self._start = 0
+        self._stop = 0
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @staticmethod
+    def _as_column(values: Sequence[Any]) -> np.ndarray:
+        """Convert values to a 1-D numeric array, or an object array otherwise."""
+        arr = np.asarray(values)
+        if arr.ndim == 1 and arr.dtype.kind in "biuf":
+            return arr
+        obj = np.empty(len(values), dtype=object)
+        obj[:] = list(values)
+        return obj
+
+    @staticmethod
+    def _with_missing(column: np.ndarray) -> np.ndarray:
+        """Return column in a dtype that can hold a missing value (NaN)."""
+        kind = column.dtype.kind
+        if kind in "fO":
+            return column
+        if kind in "iu":
+            return column.astype(np.float64)
+        return column.astype(object)
+
+    def extend(self, columns: Dict[str, Sequence[Any]], n_rows: int) -> None:
+        """Append n_rows rows given as one sequence of values per column.
+
+        A column first seen now reads as missing (NaN) in earlier rows; a
+        known column not supplied now reads as missing in the new rows.
+        """
+        if n_rows == 0:
+            return
+        if self._stop + n_rows > self._capacity:
+            self._reserve(n_rows)
+
+        start, stop = self._stop, self._stop + n_rows
+        for name, values in columns.items():
+            arr = self._as_column(values)
+            column = self._columns.get(name)
+            if column is None:
+                column = np.empty(self._capacity, dtype=arr.dtype)
+                if start > self._start:
+                    column = self._with_missing(column)
+                    column[self._start:start] = np.nan
+                self._columns[name] = column
+                self._value_dtypes[name] = arr.dtype
+                self._spans[name] = []
+            elif column.dtype != object and column.dtype != arr.dtype:
+                # Promote (e.g. int -> float64, float32 -> float64, numeric -> object)
+                promoted = object if arr.dtype == object else np.result_type(column, arr)
+                if promoted != column.dtype:
+                    column = self._columns[name] = column.astype(promoted)
+            column[start:stop] = arr
+
+            value_dtype = self._value_dtypes[name]
+            if value_dtype != arr.dtype:
+                self._value_dtypes[name] = (
+                    np.dtype(object)
+                    if object in (value_dtype, arr.dtype)
+                    else np.result_type(value_dtype, arr.dtype)
+                )
+            spans = self._spans[name]
+            if spans and spans[-1][1] == start:
+                spans[-1][1] = stop
+            else:
+                spans.append([start, stop])
+
+        for name, column in self._columns.items():
+            if name not in columns:
+                column = self._columns[name] = self._with_missing(column)
+                column[start:stop] = np.nan
+        self._stop = stop
+
+        if self._max_rows is not None and len(self) > self._max_rows:
+            self._start = self._stop - self._max_rows
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Append a single row given as a column -> value mapping."""
+        self.extend({name: [value] for name, value in row.items()}, 1)
+
+    def _reserve(self, n_rows: int) -> None:
+        """Make room for n_rows more rows: compact trimmed rows, grow 2x as needed."""
+        n_live = len(self)
+        needed = n_live + n_rows
+        # With trimming, keep at least `needed` slack so compaction stays amortized
+        target = needed if self._start == 0 else 2 * needed
+        new_capacity = max(self._capacity, self._INITIAL_CAPACITY)
+        while new_capacity < target:
+            new_capacity *= 2
+        for name, column in self._columns.items():
+            if new_capacity != self._capacity:
+                resized = np.empty(new_capacity, dtype=column.dtype)
+            else:
+                resized = column
+            resized[:n_live] = column[self._start:self._stop]
+            self._columns[name] = resized
+        shift = self._start
+        for name, spans in self._spans.items():
+            self._spans[name] = [
+                [max(begin - shift, 0), end - shift] for begin, end in spans if end > shift
+            ]
+        self._capacity = new_capacity
+        self._start, self._stop = 0, n_live
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialize the retained rows as a DataFrame (one copy per column)."""
+        if not len(self):
+            return pd.DataFrame()
+        start, stop = self._start, self._stop
+        data = {}
+        for name, column in self._columns.items():
+            covered = sum(
+                max(0, min(end, stop) - max(begin, start)) for begin, end in self._spans[name]
+            )
+            if not covered:
+                continue
+            values = column[start:stop]
+            if covered == stop - start and values.dtype != self._value_dtypes[name]:
+                # No gaps left in the window: report the values' own dtype
+                values = values.astype(self._value_dtypes[name])
+            data[name] = values
+        return pd.DataFrame(data).infer_objects()
+
+
 class DataCollector:
     """Collects data from simulations at three reporting levels.
 
@@ -21,7 +193,9 @@ class DataCollector:
     individual_reporters : dict or None
         Dict mapping metric names to callables: f(individual) -> value
     gene_reporters : dict or None
-        Dict mapping metric names to callables: f(gene) -> value
+        Dict mapping metric names to callables: f(gene) -> value.
+        ``operator.attrgetter("expression_level")`` is read from the
+        network's expression matrix in one copy instead of once per gene.
     max_history : int or None
         Maximum number of generations to retain in memory.
         If exceeded, oldest data is dropped. None = unlimited.
@@ -39,10 +213,30 @@ class DataCollector:
         self.gene_reporters: Dict[str, Callable] = gene_reporters or {}
         self.max_history: int | None = max_history
 
-        # Storage: list of dicts for each tier
-        self._model_data: List[Dict[str, Any]] = []
-        self._individual_data: List[Dict[str, Any]] = []
-        self._gene_data: List[Dict[str, Any]] = []
+        # Storage: one column store per tier (rows appended into NumPy buffers)
+        self._model_data = _ColumnStore(max_history)
+        self._individual_data = _ColumnStore(max_history)
+        self._gene_data = _ColumnStore(max_history)
+
+        # reporter -> attribute name it reads (or None), resolved on first use
+        self._reporter_attributes: Dict[Callable, Optional[str]] = {}
+
+    def _attribute_of(self, reporter: Callable) -> Optional[str]:
+        """Cached _reporter_attribute() lookup for one reporter."""
+        try:
+            return self._reporter_attributes[reporter]
+        except KeyError:
+            attr = self._reporter_attributes[reporter] = _reporter_attribute(reporter)
+            return attr
+        except TypeError:  # unhashable callable
+            return _reporter_attribute(reporter)
+
+    def _report(self, reporter: Callable, objects: Sequence[Any]) -> Sequence[Any]:
+        """Apply a reporter to every object, via attrgetter when it only reads one attribute."""
+        attr = self._attribute_of(reporter)
+        if attr is None:
+            return [reporter(obj) for obj in objects]
+        return list(map(attrgetter(attr), objects))
 
     def collect(self, model: GeneNetwork) -> None:
         """Collect data from the model at current generation.
@@ -59,35 +253,38 @@ class DataCollector:
                 row[name] = reporter(model)
             self._model_data.append(row)
 
-        # Collect individual-level data
+        # Collect individual-level data (one column per reporter, whole population)
         if self.individual_reporters:
-            for ind_idx, individual in enumerate(model.individuals):
-                row = {"generation": model.generation, "individual": ind_idx}
-                for name, reporter in self.individual_reporters.items():
-                    row[name] = reporter(individual)
-                self._individual_data.append(row)
+            individuals = model.individuals
+            n_indiv = len(individuals)
+            columns = {
+                "generation": np.full(n_indiv, model.generation),
+                "individual": np.arange(n_indiv),
+            }
+            for name, reporter in self.individual_reporters.items():
+                columns[name] = self._report(reporter, individuals)
+            self._individual_data.extend(columns, n_indiv)
 
-        # Collect gene-level data
+        # Collect gene-level data (one column per reporter, all genes)
         if self.gene_reporters:
-            for ind_idx, individual in enumerate(model.individuals):
-                for gene_idx, gene in enumerate(individual.genes):
-                    row = {
-                        "generation": model.generation,
-                        "individual": ind_idx,
-                        "gene": gene.name,
-                    }
-                    for name, reporter in self.gene_reporters.items():
-                        row[name] = reporter(gene)
-                    self._gene_data.append(row)
-
-        # Enforce max_history
-        if self.max_history is not None:
-            if len(self._model_data) > self.max_history:
-                self._model_data = self._model_data[-self.max_history :]
-            if len(self._individual_data) > self.max_history:
-                self._individual_data = self._individual_data[-self.max_history :]
-            if len(self._gene_data) > self.max_history:
-                self._gene_data = self._gene_data[-self.max_history :]
+            genes = [gene for individual in model.individuals for gene in individual.genes]
+            gene_counts = [len(individual.genes) for individual in model.individuals]
+            columns = {
+                "generation": np.full(len(genes), model.generation),
+                "individual": np.repeat(np.arange(len(gene_counts)), gene_counts),
+                "gene": [gene.name for gene in genes],
+            }
+            expression = None
+            for name, reporter in self.gene_reporters.items():
+                if self._attribute_of(reporter) == "expression_level":
+                    # Bulk copy from the network's (N, G) matrix, row-major = gene order
+                    if expression is None:
+                        expression = np.asarray(model.expression_matrix, dtype=np.float64).ravel()
+                    if expression.size == len(genes):
+                        columns[name] = expression
+                        continue
+                columns[name] = self._report(reporter, genes)
+            self._gene_data.extend(columns, len(genes))
 
     def get_model_dataframe(self) -> pd.DataFrame:
         """Get model-level data as pandas DataFrame.
@@ -97,9 +294,7 @@ class DataCollector:
         pd.DataFrame
             DataFrame with columns: generation, [reporter names]
         """
-        if not self._model_data:
-            return pd.DataFrame()
-        return pd.DataFrame(self._model_data)
+        return self._model_data.to_dataframe()
 
     def get_individual_dataframe(self) -> pd.DataFrame:
         """Get individual-level data as pandas DataFrame.
@@ -109,9 +304,7 @@ class DataCollector:
         pd.DataFrame
             DataFrame with columns: generation, individual, [reporter names]
         """
-        if not self._individual_data:
-            return pd.DataFrame()
-        return pd.DataFrame(self._individual_data)
+        return self._individual_data.to_dataframe()
 
     def get_gene_dataframe(self) -> pd.DataFrame:
         """Get gene-level data as pandas DataFrame.
@@ -121,6 +314,4 @@ class DataCollector:
         pd.DataFrame
             DataFrame with columns: generation, individual, gene, [reporter names]
         """
-        if not self._gene_data:
-            return pd.DataFrame()
-        return pd.DataFrame(self._gene_data)
+        return self._gene_data.to_dataframe()
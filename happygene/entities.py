@@ -1,11 +1,23 @@
 """Gene and Individual entity classes."""
 
-from typing import List
+import sys
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+def _intern_name(name: str) -> str:
+    """Intern exact ``str`` names; other name types (e.g. numpy.str_) are kept as given."""
+    return sys.intern(name) if type(name) is str else name
 
 
 class Gene:
     """Represents a single gene with expression level.
 
+    A standalone gene stores its own level. Once its individual joins a
+    GeneNetwork, the level lives in the network's (n_individuals, n_genes)
+    expression matrix and the gene reads it through a row view.
+
     Parameters
     ----------
     name : str
@@ -14,33 +26,190 @@ class Gene:
         Current expression level. Negative values are clamped to 0.
     """
 
-    __slots__ = ('name', '_expression_level')
+    __slots__ = ('name', '_expression_level', '_row', '_col')
 
     def __init__(self, name: str, expression_level: float):
-        self.name: str = name
+        # Interned so a population holds one string per gene name, not per gene
+        self.name: str = _intern_name(name)
         # Clamp expression level to [0, inf)
         self._expression_level: float = max(0.0, expression_level)
+        # Backing row of a population matrix (None while standalone)
+        self._row: Optional[np.ndarray] = None
+        self._col: int = 0
+
+    @classmethod
+    def bulk(cls, names: Sequence[str], levels: Sequence[float]) -> List["Gene"]:
+        """Build standalone genes for aligned names and levels in one pass.
+
+        Equivalent to ``[Gene(n, l) for n, l in zip(names, levels)]`` but fills
+        the slots directly instead of dispatching ``__init__`` per gene.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            Gene names.
+        levels : Sequence[float] or np.ndarray
+            Expression levels aligned with ``names`` (negatives clamped to 0).
+
+        Returns
+        -------
+        List[Gene]
+            One new gene per name.
+
+        Raises
+        ------
+        ValueError
+            If names and levels differ in length.
+        """
+        if len(names) != len(levels):
+            raise ValueError(f"expected {len(names)} expression levels, got {len(levels)}")
+        if isinstance(levels, np.ndarray):
+            levels = levels.tolist()
+
+        new, intern = cls.__new__, _intern_name
+        genes = []
+        append = genes.append
+        for name, level in zip(names, levels):
+            gene = new(cls)
+            gene.name = intern(name)
+            gene._expression_level = max(0.0, level)
+            gene._row = None
+            gene._col = 0
+            append(gene)
+        return genes
+
+    @classmethod
+    def _bulk_bound(cls, names: Sequence[str], row: np.ndarray) -> List["Gene"]:
+        """Build genes that read their levels from consecutive columns of ``row``."""
+        new, intern = cls.__new__, _intern_name
+        genes = []
+        append = genes.append
+        for col, name in enumerate(names):
+            gene = new(cls)
+            gene.name = intern(name)
+            gene._expression_level = 0.0
+            gene._row = row
+            gene._col = col
+            append(gene)
+        return genes
 
     @property
     def expression_level(self) -> float:
         """Current expression level (always >= 0)."""
-        return self._expression_level
+        if self._row is None:
+            return self._expression_level
+        return float(self._row[self._col])
+
+    def _assign(self, level: float) -> None:
+        """Store an already-clamped level in whichever storage backs this gene."""
+        if self._row is None:
+            self._expression_level = level
+        else:
+            self._row[self._col] = level
 
 
 class Individual:
     """Represents an individual in the population with genes and fitness.
 
+    A standalone individual stores its own fitness. Once it joins a
+    GeneNetwork, fitness lives in the network's (n_individuals,) fitness
+    array and the individual reads and writes its entry there.
+
     Parameters
     ----------
     genes : List[Gene]
         List of Gene objects in this individual.
     """
 
-    __slots__ = ('genes', 'fitness')
+    __slots__ = ('genes', '_fitness', '_fitness_store', '_index')
 
     def __init__(self, genes: List[Gene]):
         self.genes: List[Gene] = genes
-        self.fitness: float = 1.0
+        self._fitness: float = 1.0
+        # Backing fitness array of a population (None while standalone)
+        self._fitness_store: Optional[np.ndarray] = None
+        self._index: int = 0
+
+    @property
+    def fitness(self) -> float:
+        """Current fitness value."""
+        if self._fitness_store is None:
+            return self._fitness
+        return float(self._fitness_store[self._index])
+
+    @fitness.setter
+    def fitness(self, value: float) -> None:
+        if self._fitness_store is None:
+            self._fitness = value
+        else:
+            self._fitness_store[self._index] = value
+
+    @classmethod
+    def from_row(cls, names: Sequence[str], levels: Sequence[float]) -> "Individual":
+        """Build an individual from gene names and one row of expression levels.
+
+        Lets callers draw a whole population's expression as a single
+        (n_individuals, n_genes) array and build individuals row by row.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            Gene names, one per column.
+        levels : Sequence[float] or np.ndarray
+            Expression levels aligned with ``names`` (negatives clamped to 0).
+
+        Returns
+        -------
+        Individual
+            New individual with one Gene per name.
+
+        Raises
+        ------
+        ValueError
+            If names and levels differ in length.
+        """
+        levels = np.asarray(levels, dtype=np.float64)
+        if levels.shape != (len(names),):
+            raise ValueError(
+                f"expected {len(names)} expression levels, got shape {levels.shape}"
+            )
+        # Genes view one owned, clamped row instead of boxing a float each
+        return cls(Gene._bulk_bound(names, np.maximum(levels, 0.0)))
+
+    @property
+    def expression(self) -> np.ndarray:
+        """Snapshot of this individual's gene expression levels.
+
+        When every gene views consecutive columns of one shared row (as
+        after ``from_row`` or once bound to a GeneNetwork), the row is
+        copied in its own dtype (the network's dtype, e.g. float32, once
+        bound); otherwise levels are gathered into a new float64 array.
+        Either way the result is independent of the genes: later steps do
+        not change it and writing to it does not change the genes.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (n_genes,) array of expression levels.
+        """
+        row = self._shared_row()
+        if row is not None:
+            return row.copy()
+        genes = self.genes
+        return np.fromiter(
+            (gene.expression_level for gene in genes), dtype=np.float64, count=len(genes)
+        )
+
+    def _shared_row(self) -> Optional[np.ndarray]:
+        """The row all genes view in order (no copy), or None if there is none."""
+        genes = self.genes
+        if genes:
+            row = genes[0]._row
+            if row is not None and row.shape[0] == len(genes) and all(
+                gene._row is row and gene._col == col for col, gene in enumerate(genes)
+            ):
+                return row
+        return None
 
     def mean_expression(self) -> float:
         """Compute mean expression level across all genes.
@@ -52,4 +221,5 @@ class Individual:
         """
         if not self.genes:
             return 0.0
-        return sum(gene.expression_level for gene in self.genes) / len(self.genes)
+        row = self._shared_row()
+        return float(np.mean(row if row is not None else self.expression))
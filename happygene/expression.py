@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from happygene.conditions import Conditions
 
 
@@ -13,6 +15,8 @@ class ExpressionModel(ABC):
     Hill, constant, etc.).
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def compute(self, conditions: Conditions) -> float:
         """Compute expression level given conditions.
@@ -29,6 +33,45 @@ class ExpressionModel(ABC):
         """
         ...
 
+    def compute_batch(self, conditions: Conditions, out: np.ndarray) -> np.ndarray:
+        """Fill an expression matrix for a whole population (vectorized).
+
+        Base models depend only on conditions, so a single compute() call is
+        broadcast to every entry. Subclasses may override with cheaper paths.
+
+        Parameters
+        ----------
+        conditions : Conditions
+            Environmental conditions.
+        out : np.ndarray
+            Expression matrix of shape (n_individuals, n_genes), overwritten in-place.
+
+        Returns
+        -------
+        np.ndarray
+            The filled ``out`` array (all entries >= 0).
+        """
+        out.fill(max(0.0, self.compute(conditions)))
+        return out
+
+    def broadcast_level(self, conditions: Conditions) -> float | None:
+        """Level shared by every entry of compute_batch(), if there is one.
+
+        Lets callers use a scalar instead of reading a filled matrix back.
+        Returns None (the default) when entries may differ or are unknown.
+
+        Parameters
+        ----------
+        conditions : Conditions
+            Environmental conditions.
+
+        Returns
+        -------
+        float or None
+            The uniform expression level (>= 0), or None.
+        """
+        return None
+
 
 class LinearExpression(ExpressionModel):
     """Linear expression model: E = slope * tf_concentration + intercept.
@@ -46,6 +89,8 @@ class LinearExpression(ExpressionModel):
         If intercept < 0.
     """
 
+    __slots__ = ('slope', 'intercept')
+
     def __init__(self, slope: float, intercept: float):
         if intercept < 0.0:
             raise ValueError(f"intercept must be >= 0, got {intercept}")
@@ -60,6 +105,15 @@ class LinearExpression(ExpressionModel):
         result = self.slope * conditions.tf_concentration + self.intercept
         return max(0.0, result)
 
+    def compute_batch(self, conditions: Conditions, out: np.ndarray) -> np.ndarray:
+        """Fill ``out`` with the (already clamped) linear response in one pass."""
+        out.fill(self.compute(conditions))
+        return out
+
+    def broadcast_level(self, conditions: Conditions) -> float:
+        """The linear response depends only on conditions: one scalar for all genes."""
+        return self.compute(conditions)
+
     def __repr__(self) -> str:
         return f"LinearExpression(slope={self.slope}, intercept={self.intercept})"
 
@@ -78,6 +132,8 @@ class ConstantExpression(ExpressionModel):
         If level < 0.
     """
 
+    __slots__ = ('level',)
+
     def __init__(self, level: float):
         if level < 0.0:
             raise ValueError(f"level must be >= 0, got {level}")
@@ -87,6 +143,15 @@ class ConstantExpression(ExpressionModel):
         """Return fixed expression level regardless of conditions."""
         return self.level
 
+    def compute_batch(self, conditions: Conditions, out: np.ndarray) -> np.ndarray:
+        """Fill ``out`` with the fixed level; conditions are never consulted."""
+        out.fill(self.level)
+        return out
+
+    def broadcast_level(self, conditions: Conditions) -> float:
+        """Every entry takes the fixed level."""
+        return self.level
+
     def __repr__(self) -> str:
         return f"ConstantExpression(level={self.level})"
 
@@ -114,6 +179,8 @@ class HillExpression(ExpressionModel):
         If v_max < 0, k <= 0, or n <= 0.
     """
 
+    __slots__ = ('v_max', '_k', '_n', '_k_pow_n')
+
     def __init__(self, v_max: float, k: float, n: float):
         if v_max < 0.0:
             raise ValueError(f"v_max must be >= 0, got {v_max}")
@@ -123,8 +190,29 @@ class HillExpression(ExpressionModel):
             raise ValueError(f"n must be > 0, got {n}")
 
         self.v_max: float = v_max
-        self.k: float = k
-        self.n: float = n
+        self._k: float = k
+        self._n: float = n
+        self._k_pow_n: float = k**n
+
+    @property
+    def k(self) -> float:
+        """Half-saturation coefficient."""
+        return self._k
+
+    @k.setter
+    def k(self, value: float) -> None:
+        self._k = value
+        self._k_pow_n = value**self._n
+
+    @property
+    def n(self) -> float:
+        """Hill coefficient."""
+        return self._n
+
+    @n.setter
+    def n(self, value: float) -> None:
+        self._n = value
+        self._k_pow_n = self._k**value
 
     def compute(self, conditions: Conditions) -> float:
         """Compute Hill equation response.
@@ -134,10 +222,13 @@ class HillExpression(ExpressionModel):
         Result is always in range [0, v_max].
         """
         tf = conditions.tf_concentration
-        tf_power = tf**self.n
-        k_power = self.k**self.n
-        result = self.v_max * tf_power / (k_power + tf_power)
+        tf_power = tf**self._n
+        result = self.v_max * tf_power / (self._k_pow_n + tf_power)
         return max(0.0, result)
 
+    def broadcast_level(self, conditions: Conditions) -> float:
+        """The Hill response depends only on conditions: one scalar for all genes."""
+        return self.compute(conditions)
+
     def __repr__(self) -> str:
         return f"HillExpression(v_max={self.v_max}, k={self.k}, n={self.n})"
@@ -1,11 +1,11 @@
 """GeneNetwork: the main simulation model."""
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence
 
 import numpy as np
 
 from happygene.base import SimulationModel
 from happygene.conditions import Conditions
-from happygene.entities import Individual
+from happygene.entities import Gene, Individual
 from happygene.expression import ExpressionModel
 from happygene.mutation import MutationModel
 from happygene.regulatory_network import RegulatoryNetwork
@@ -32,6 +32,11 @@ class GeneNetwork(SimulationModel):
         Random seed for reproducibility.
     conditions : Conditions or None
         Environmental conditions (default: Conditions()).
+    regulatory_network : RegulatoryNetwork or None
+        Gene-to-gene regulatory interactions (default: None).
+    dtype : numpy floating dtype
+        Element type of the population expression matrix (default float64).
+        float32 halves its memory and bandwidth at single precision.
     """
 
     def __init__(
@@ -43,93 +48,308 @@ class GeneNetwork(SimulationModel):
         seed: int | None = None,
         conditions: Conditions | None = None,
         regulatory_network: Optional[RegulatoryNetwork] = None,
+        dtype: np.dtype = np.float64,
     ):
         super().__init__(seed=seed)
+        self._dtype: np.dtype = np.dtype(dtype)
+        if not np.issubdtype(self._dtype, np.floating):
+            raise ValueError(f"dtype must be a floating-point type, got {self._dtype}")
         self.individuals: List[Individual] = individuals
         self.expression_model: ExpressionModel = expression_model
         self.selection_model: SelectionModel = selection_model
         self.mutation_model: MutationModel = mutation_model
         self.conditions: Conditions = conditions or Conditions()
         self._regulatory_network: Optional[RegulatoryNetwork] = regulatory_network
+        # Population state as SoA: expression matrix (n_individuals, n_genes)
+        # shared with the genes via row views; rebuilt if the population changes
+        self._expr: np.ndarray = np.empty((0, 0), dtype=self._dtype)
+        self._fitness: np.ndarray = np.empty(0)
+        self._bound_individuals: List[Individual] = []
+        self._bound_gene_lists: List[List[Gene]] = []
+        self._bound_gene_counts: List[int] = []
+        self._bind_population()
+        # Reusable TF input buffer for the regulatory step (allocated lazily)
+        self._tf_matrix: Optional[np.ndarray] = None
+        # Expression phase specialized for the current (expression model,
+        # regulatory network) pair; re-resolved only when either changes
+        self._express: Callable[[np.ndarray], None] = self._express_unregulated
+        self._express_key: tuple = ()
+
+    @classmethod
+    def from_arrays(
+        cls,
+        expr_init: np.ndarray,
+        gene_names: Sequence[str],
+        expression_model: ExpressionModel,
+        selection_model: SelectionModel,
+        mutation_model: MutationModel,
+        seed: int | None = None,
+        conditions: Conditions | None = None,
+        regulatory_network: Optional[RegulatoryNetwork] = None,
+        dtype: np.dtype = np.float64,
+    ) -> "GeneNetwork":
+        """Build a network directly from an initial expression matrix.
+
+        The matrix becomes the population state as-is (copied once, negatives
+        clamped to 0) and genes are bound to its rows on creation, so no
+        per-gene Python floats are allocated or gathered.
+
+        Parameters
+        ----------
+        expr_init : np.ndarray
+            Initial expression levels, shape (n_individuals, n_genes).
+        gene_names : Sequence[str]
+            Gene names, one per column of expr_init.
+        expression_model, selection_model, mutation_model, seed, conditions
+            As for GeneNetwork.
+        regulatory_network, dtype
+            As for GeneNetwork.
+
+        Returns
+        -------
+        GeneNetwork
+            Network whose individuals read expression from the matrix.
+
+        Raises
+        ------
+        ValueError
+            If expr_init is not 2-D or its columns do not match gene_names,
+            or dtype is not a floating-point type.
+        """
+        expr_matrix = np.array(expr_init, dtype=dtype)
+        if expr_matrix.ndim != 2 or expr_matrix.shape[1] != len(gene_names):
+            raise ValueError(
+                f"expr_init shape {expr_matrix.shape} does not match "
+                f"{len(gene_names)} gene names"
+            )
+        np.maximum(expr_matrix, 0.0, out=expr_matrix)
+
+        fitness = np.ones(expr_matrix.shape[0])
+        individuals = []
+        for index, row in enumerate(expr_matrix):
+            individual = Individual(Gene._bulk_bound(gene_names, row))
+            individual._fitness_store = fitness
+            individual._index = index
+            individuals.append(individual)
+
+        network = cls(
+            [],
+            expression_model,
+            selection_model,
+            mutation_model,
+            seed=seed,
+            conditions=conditions,
+            regulatory_network=regulatory_network,
+            dtype=dtype,
+        )
+        network.individuals = individuals
+        network._expr = expr_matrix
+        network._fitness = fitness
+        network._record_binding()
+        return network
 
     def step(self) -> None:
         """Advance the simulation by one generation.
 
-        Implements the full life cycle with vectorized expression computation:
+        Implements the full life cycle on the population expression matrix
+        (genes read their levels from it, so no per-gene write-back):
         1. Expression: Compute gene expression using expression_model (VECTORIZED)
-           - Build expression_matrix: (n_individuals, n_genes) NumPy array
-           - If regulatory_network provided, compute TF inputs via sparse matrix
-           - Use NumPy broadcasting for efficient computation
-           - Update genes in-place from matrix
-        2. Selection: Evaluate fitness using selection_model
-        3. Mutation: Introduce variation using mutation_model
+           - If regulatory_network provided, compute TF inputs for the whole
+             population in one matrix product, then overwrite expression in-place
+        2. Selection: Evaluate fitness using selection_model (one batch call)
+        3. Mutation: Introduce variation using mutation_model (on the matrix)
         4. Increment: Advance generation counter
         """
-        # Phase 1: Vectorized expression computation
-        n_indiv = len(self.individuals)
+        self._sync_population()
+        self._advance(1)
+
+    def run(self, generations: int) -> None:
+        """Run simulation for a fixed number of generations.
 
-        if n_indiv == 0:
+        Same result as calling step() ``generations`` times, but the population
+        is synced and the phase implementations are looked up once for the
+        whole run instead of once per generation. Subclasses (or instances)
+        that override step() keep the generic per-step loop.
+
+        Parameters
+        ----------
+        generations : int
+            Number of generations to simulate.
+        """
+        if getattr(self.step, '__func__', None) is not GeneNetwork.step:
+            super().run(generations)
+            return
+        # Nothing inside the fused loop can stop the model, so checking the
+        # running flag once matches the per-step check of the generic loop
+        if not self._running or generations <= 0:
+            return
+        self._sync_population()
+        self._advance(generations)
+
+    def _advance(self, generations: int) -> None:
+        """Run the life cycle on the bound population matrix (see step()).
+
+        Always advances exactly ``generations`` generations; checking the
+        running flag is up to run().
+        """
+        expr_matrix = self._expr
+
+        if expr_matrix.shape[0] == 0:
+            self._generation += generations
+            return
+
+        # Phase implementations are fixed for the run: nothing inside the
+        # loop replaces the models, the network or the population
+        if self._express_key != (self.expression_model, self._regulatory_network):
+            self._resolve_expression_phase()
+        express = self._express
+        compute_fitness_batch = self.selection_model.compute_fitness_batch
+        mutate_batch = self.mutation_model.mutate_batch
+        fitness = self._fitness
+        individuals = self.individuals
+        # The generator is seeded lazily: only build it if mutation draws from it
+        rng = self.rng if self.mutation_model.uses_rng() else None
+
+        for _ in range(generations):
+            # Phase 1: Vectorized expression computation (specialized per configuration)
+            express(expr_matrix)
+            # Phase 2: Evaluate fitness for the whole population in one batch call
+            # (individuals read their fitness from self._fitness; one array copy)
+            fitness[...] = compute_fitness_batch(expr_matrix)
+            # Phase 3: Apply mutations to the expression matrix (in-place)
+            mutate_batch(individuals, expr_matrix, rng)
+            # Phase 4: Increment generation
             self._generation += 1
+
+    def _resolve_expression_phase(self) -> None:
+        """Pick the expression-phase implementation for the configured models.
+
+        Only composite models (with a regulatory_model) consume TF inputs, so
+        the regulated path is used only when both a network and such a model
+        are present.
+        """
+        uses_tf_inputs = (
+            self._regulatory_network is not None
+            and hasattr(self.expression_model, 'regulatory_model')
+        )
+        self._express = (
+            self._express_regulated if uses_tf_inputs else self._express_unregulated
+        )
+        self._express_key = (self.expression_model, self._regulatory_network)
+
+    def _express_regulated(self, expr_matrix: np.ndarray) -> None:
+        """Composite expression driven by population-wide TF inputs (in-place)."""
+        # TF inputs from the current expression for every individual in one
+        # matrix product, written into a buffer reused across generations
+        if self._tf_matrix is None or self._tf_matrix.shape != expr_matrix.shape:
+            self._tf_matrix = np.empty_like(expr_matrix)
+        self._regulatory_network.compute_tf_inputs_batch(expr_matrix, out=self._tf_matrix)
+        # Base expression + regulatory overlay over the whole matrix (clamped >= 0);
+        # safe in-place because TF inputs no longer depend on expr_matrix
+        self.expression_model.compute_batch(
+            self.conditions, expr_matrix, tf_inputs=self._tf_matrix
+        )
+
+    def _express_unregulated(self, expr_matrix: np.ndarray) -> None:
+        """Condition-only expression: the model fills the whole matrix in one call."""
+        self.expression_model.compute_batch(self.conditions, expr_matrix)
+
+    def _sync_population(self) -> None:
+        """Rebind if the population or any individual's gene list changed.
+
+        Catches a replaced or edited population list, a reassigned
+        ``individual.genes`` list and genes appended to or removed from one,
+        in O(n_individuals). Replacing a gene in place
+        (``individual.genes[i] = Gene(...)``) is not detected; assign a new
+        list instead. One Gene object shared by several individuals is not
+        supported either.
+        """
+        individuals = self.individuals
+        if individuals != self._bound_individuals:
+            self._bind_population()
             return
+        # Unchanged lists compare by identity without visiting their genes;
+        # a reassigned list is only scanned when it is a different object
+        gene_lists = [individual.genes for individual in individuals]
+        if gene_lists != self._bound_gene_lists or (
+            list(map(len, gene_lists)) != self._bound_gene_counts
+        ):
+            self._bind_population()
 
-        # Determine n_genes from first individual
-        n_genes = len(self.individuals[0].genes)
-
-        # Initialize expression matrix
-        expr_matrix = np.zeros((n_indiv, n_genes))
-
-        if self._regulatory_network is not None:
-            # Vectorized regulatory computation
-            for ind_idx, individual in enumerate(self.individuals):
-                # Get current expression for this individual
-                prev_expr = np.array([g.expression_level for g in individual.genes])
-                # Compute TF inputs: adjacency @ expression (sparse matrix operations)
-                tf_inputs = self._regulatory_network.compute_tf_inputs(prev_expr)
-
-                # Check if model is composite (has regulatory_model)
-                if hasattr(self.expression_model, 'regulatory_model'):
-                    # Apply expression model with TF inputs for each gene
-                    for gene_idx in range(n_genes):
-                        expr = self.expression_model.compute(
-                            self.conditions,
-                            tf_inputs=tf_inputs[gene_idx]
-                        )
-                        expr_matrix[ind_idx, gene_idx] = max(0.0, expr)
-                else:
-                    # Fallback: compute base model without TF inputs
-                    for gene_idx in range(n_genes):
-                        expr = self.expression_model.compute(self.conditions)
-                        expr_matrix[ind_idx, gene_idx] = max(0.0, expr)
-        else:
-            # No regulation: vectorize across all individuals and genes
-            # Compute single expression value and broadcast to all
-            expr_val = self.expression_model.compute(self.conditions)
-            expr_matrix[:, :] = max(0.0, expr_val)
-
-        # Update individuals from expression matrix (in-place)
-        for ind_idx, individual in enumerate(self.individuals):
-            for gene_idx, gene in enumerate(individual.genes):
-                gene._expression_level = expr_matrix[ind_idx, gene_idx]
-
-        # Phase 2: Evaluate fitness (vectorized via batch methods)
-        # Use selection_model.compute_fitness_batch for vectorized fitness computation
-        # All selection models support batch computation
-        if n_genes > 0:
-            fitness_values = self.selection_model.compute_fitness_batch(expr_matrix)
-            for ind_idx, individual in enumerate(self.individuals):
-                individual.fitness = fitness_values[ind_idx]
+    def _bind_population(self) -> None:
+        """Move all gene expression levels into one matrix and bind genes to it.
+
+        Each gene keeps a row view of the (n_indiv, n_genes) matrix plus its
+        column index, so expression lives in one contiguous buffer of the
+        network's dtype; every individual must have the same number of genes
+        (ValueError otherwise). Each individual needs a row of its own:
+        repeats in the population and individuals still bound to another
+        population are replaced (in ``self.individuals``) by independent copies.
+        """
+        individuals = self.individuals
+        seen = set()
+        for index, individual in enumerate(individuals):
+            store = individual._fitness_store
+            if id(individual) in seen or (store is not None and store is not self._fitness):
+                copy = Individual.from_row(
+                    [gene.name for gene in individual.genes], individual.expression
+                )
+                copy.fitness = individual.fitness
+                individuals[index] = individual = copy
+            seen.add(id(individual))
+
+        n_indiv = len(individuals)
+        n_genes = len(individuals[0].genes) if n_indiv else 0
+        for index, individual in enumerate(individuals):
+            if len(individual.genes) != n_genes:
+                raise ValueError(
+                    f"individual {index} has {len(individual.genes)} genes, but individual 0 "
+                    f"has {n_genes}; every individual needs the same number of genes"
+                )
+
+        # Concatenate each individual's expression row (zero-copy views for
+        # row-backed individuals, a gather for standalone genes)
+        if n_indiv:
+            levels = np.concatenate(
+                [ind.expression for ind in individuals], dtype=self._dtype
+            )
         else:
-            # Empty genes: use per-individual computation
-            for individual in self.individuals:
-                fitness = self.selection_model.compute_fitness(individual)
-                individual.fitness = fitness
+            levels = np.empty(0, dtype=self._dtype)
+        expr_matrix = levels.reshape(n_indiv, n_genes)
 
-        # Phase 3: Apply mutations
-        for individual in self.individuals:
-            self.mutation_model.mutate(individual, self.rng)
+        fitness = np.fromiter(
+            (ind.fitness for ind in individuals), dtype=np.float64, count=n_indiv
+        )
 
-        # Phase 4: Increment generation
-        self._generation += 1
+        for index, (individual, row) in enumerate(zip(individuals, expr_matrix)):
+            for col, gene in enumerate(individual.genes):
+                gene._row = row
+                gene._col = col
+            individual._fitness_store = fitness
+            individual._index = index
+
+        self._expr = expr_matrix
+        self._fitness = fitness
+        self._record_binding()
+
+    def _record_binding(self) -> None:
+        """Remember the population and gene lists the matrix was bound to."""
+        self._bound_individuals = list(self.individuals)
+        self._bound_gene_lists = [individual.genes for individual in self.individuals]
+        self._bound_gene_counts = list(map(len, self._bound_gene_lists))
+
+    @property
+    def expression_matrix(self) -> np.ndarray:
+        """Population expression levels, one row per individual.
+
+        Returns
+        -------
+        np.ndarray
+            The (n_individuals, n_genes) matrix the genes read from (not a
+            copy; writes are seen by the genes).
+        """
+        self._sync_population()
+        return self._expr
 
     @property
     def regulatory_network(self) -> Optional[RegulatoryNetwork]:
@@ -153,6 +373,24 @@ class GeneNetwork(SimulationModel):
         """
         self._regulatory_network = value
 
+    def compute_mean_expression(self) -> np.ndarray:
+        """Compute every individual's mean expression in one reduction.
+
+        Batch form of Individual.mean_expression() over the population
+        matrix, for callers that want all individuals at once.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (n_individuals,) float64 means (0.0 for individuals without
+            genes).
+        """
+        self._sync_population()
+        expr_matrix = self._expr
+        if expr_matrix.shape[1] == 0:
+            return np.zeros(expr_matrix.shape[0])
+        return expr_matrix.mean(axis=1, dtype=np.float64)
+
     def compute_mean_fitness(self) -> float:
         """Compute mean fitness across all individuals.
 
@@ -161,6 +399,7 @@ class GeneNetwork(SimulationModel):
         float
             Mean fitness. Returns 0.0 if population is empty.
         """
+        self._sync_population()
         if not self.individuals:
             return 0.0
-        return sum(ind.fitness for ind in self.individuals) / len(self.individuals)
+        return float(np.mean(self._fitness))
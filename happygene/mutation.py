@@ -1,11 +1,16 @@
 """Mutation models for genetic variation introduction."""
 
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 import numpy as np
 
 from happygene.entities import Individual
 
+# Above this rate a full per-locus uniform draw beats sampling the mutated
+# loci without replacement
+_SPARSE_RATE_MAX = 0.5
+
 
 class MutationModel(ABC):
     """Abstract base class for mutation models.
@@ -15,6 +20,8 @@ class MutationModel(ABC):
     mutation mechanisms.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def mutate(self, individual: Individual, rng: np.random.Generator) -> None:
         """Apply mutations to an individual.
@@ -28,6 +35,51 @@ class MutationModel(ABC):
         """
         ...
 
+    def mutate_batch(
+        self,
+        individuals: List[Individual],
+        expr_matrix: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """Apply mutations to a whole population's expression matrix.
+
+        Default syncs each row into its individual, calls mutate(), and reads
+        the result back. Subclasses override with a vectorized matrix update.
+
+        Parameters
+        ----------
+        individuals : List[Individual]
+            Individuals whose genes correspond to the rows of expr_matrix.
+        expr_matrix : np.ndarray
+            Expression matrix of shape (n_individuals, n_genes), modified in-place.
+        rng : np.random.Generator
+            Random number generator for stochastic mutations.
+
+        Returns
+        -------
+        np.ndarray
+            The mutated ``expr_matrix``.
+        """
+        for individual, row in zip(individuals, expr_matrix):
+            for gene, level in zip(individual.genes, row.tolist()):
+                gene._assign(level)
+            self.mutate(individual, rng)
+            row[:] = individual.expression
+        return expr_matrix
+
+    def uses_rng(self) -> bool:
+        """Whether mutate_batch() may draw from its generator (default True).
+
+        Models that return False receive ``rng=None``, which lets the
+        simulation skip creating its generator at all.
+
+        Returns
+        -------
+        bool
+            False only if mutate_batch() never draws random numbers.
+        """
+        return True
+
 
 class PointMutation(MutationModel):
     """Point mutation: random Gaussian perturbations to gene expression.
@@ -49,6 +101,8 @@ class PointMutation(MutationModel):
         If rate not in [0, 1] or magnitude < 0.
     """
 
+    __slots__ = ('rate', 'magnitude', '_uniform', '_mutated')
+
     def __init__(self, rate: float, magnitude: float):
         if rate < 0.0 or rate > 1.0:
             raise ValueError(f"rate must be in [0, 1], got {rate}")
@@ -57,6 +111,9 @@ class PointMutation(MutationModel):
 
         self.rate: float = rate
         self.magnitude: float = magnitude
+        # Reusable (n_individuals, n_genes) buffers for batch mutation decisions
+        self._uniform: Optional[np.ndarray] = None
+        self._mutated: Optional[np.ndarray] = None
 
     def mutate(self, individual: Individual, rng: np.random.Generator) -> None:
         """Apply point mutations to individual's genes using vectorized batch RNG.
@@ -65,8 +122,11 @@ class PointMutation(MutationModel):
         - With probability rate: apply Gaussian perturbation with std=magnitude
         - Result clamped to [0, inf)
 
-        Uses vectorized RNG batch calls for improved performance (2.84x faster
-        than per-gene random number generation).
+        Uses the same sampling as mutate_batch(): at low rates the number of
+        mutations is drawn from Binomial(n_genes, rate) and that many distinct
+        loci are sampled directly; at high rates all decisions are drawn in
+        one RNG call. Perturbations are drawn only for the mutated loci, and
+        only those genes are touched from Python.
 
         Parameters
         ----------
@@ -75,20 +135,92 @@ class PointMutation(MutationModel):
         rng : np.random.Generator
             Random number generator.
         """
-        n_genes = len(individual.genes)
-        if n_genes == 0:
+        genes = individual.genes
+        n_genes = len(genes)
+        if n_genes == 0 or self.rate == 0.0 or self.magnitude == 0.0:
+            # No gene can change: skip all RNG work
             return
 
-        # Vectorized: generate all decisions and perturbations in batch
-        # This reduces per-gene overhead: ~0.25s vs 0.72s for 5k×100 benchmark
-        decisions = rng.random(n_genes)
-        perturbations = rng.normal(0.0, self.magnitude, n_genes)
+        if self.rate <= _SPARSE_RATE_MAX:
+            n_mutated = rng.binomial(n_genes, self.rate)
+            if n_mutated == 0:
+                return
+            mutated = rng.choice(n_genes, size=n_mutated, replace=False)
+        else:
+            mutated = np.flatnonzero(rng.random(n_genes) < self.rate)
+            n_mutated = len(mutated)
+        perturbations = rng.standard_normal(n_mutated) * self.magnitude
+
+        for i, delta in zip(mutated.tolist(), perturbations.tolist()):
+            gene = genes[i]
+            gene._assign(max(0.0, gene.expression_level + delta))
+
+    def mutate_batch(
+        self,
+        individuals: List[Individual],
+        expr_matrix: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """Apply point mutations to the whole expression matrix at once.
+
+        Each locus mutates independently with probability rate. At low rates
+        the number of mutations is drawn from Binomial(n_loci, rate) and that
+        many distinct loci are sampled directly (same distribution, no
+        per-locus draw); at high rates all decisions are drawn in one RNG
+        call. Gaussian perturbations are drawn only for the loci that mutate,
+        and when rate or magnitude is zero no random numbers are drawn at all.
 
-        # Apply mutations following vectorized decisions
-        for i, gene in enumerate(individual.genes):
-            if decisions[i] < self.rate:
-                new_level = gene._expression_level + perturbations[i]
-                gene._expression_level = max(0.0, new_level)
+        Parameters
+        ----------
+        individuals : List[Individual]
+            Unused; the matrix is the source of truth for expression.
+        expr_matrix : np.ndarray
+            Expression matrix of shape (n_individuals, n_genes), modified in-place.
+        rng : np.random.Generator
+            Random number generator.
+
+        Returns
+        -------
+        np.ndarray
+            The mutated ``expr_matrix`` (all entries >= 0).
+        """
+        if expr_matrix.size == 0 or self.rate == 0.0 or self.magnitude == 0.0:
+            # No entry can change: skip all RNG work
+            return expr_matrix
+
+        if self.rate <= _SPARSE_RATE_MAX and expr_matrix.flags.c_contiguous:
+            # Sparse path: sample the mutated loci on the flat matrix view
+            flat = expr_matrix.reshape(-1)
+            n_mutated = rng.binomial(flat.size, self.rate)
+            if n_mutated == 0:
+                return expr_matrix
+            loci = rng.choice(flat.size, size=n_mutated, replace=False)
+            levels = flat[loci]
+            levels += rng.standard_normal(n_mutated) * self.magnitude
+            np.maximum(levels, 0.0, out=levels)
+            flat[loci] = levels
+            return expr_matrix
+
+        # Dense path: decisions drawn into preallocated buffers
+        if self._uniform is None or self._uniform.shape != expr_matrix.shape:
+            self._uniform = np.empty(expr_matrix.shape)
+            self._mutated = np.empty(expr_matrix.shape, dtype=bool)
+        rng.random(out=self._uniform)
+        mutated = np.less(self._uniform, self.rate, out=self._mutated)
+        n_mutated = np.count_nonzero(mutated)
+        if n_mutated == 0:
+            return expr_matrix
+
+        # Perturb only the mutated loci (rate * N * G normal draws, not N * G)
+        levels = expr_matrix[mutated]
+        levels += rng.standard_normal(n_mutated) * self.magnitude
+        np.maximum(levels, 0.0, out=levels)
+        expr_matrix[mutated] = levels
+        return expr_matrix
+
+    def uses_rng(self) -> bool:
+        """No random numbers are drawn when rate or magnitude is zero."""
+        return self.rate != 0.0 and self.magnitude != 0.0
 
     def __repr__(self) -> str:
         return f"PointMutation(rate={self.rate}, magnitude={self.magnitude})"
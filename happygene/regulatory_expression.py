@@ -13,6 +13,9 @@ Design rationale (ADR-005):
 - Immutable: Both models are stored as properties (no post-init modification)
 """
 from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
 
 from happygene.conditions import Conditions
 from happygene.expression import ExpressionModel
@@ -32,6 +35,8 @@ class RegulatoryExpressionModel(ABC):
         (positive = activation, negative = repression).
     """
 
+    __slots__ = ('weight', '_scratch')
+
     def __init__(self, weight: float):
         """Initialize regulatory model.
 
@@ -42,6 +47,13 @@ class RegulatoryExpressionModel(ABC):
         """
         self.weight: float = weight
 
+    def _scratch_like(self, shape, dtype=np.float64) -> np.ndarray:
+        """Return a scratch buffer of ``shape`` and ``dtype``, reused across calls."""
+        scratch = getattr(self, '_scratch', None)
+        if scratch is None or scratch.shape != shape or scratch.dtype != dtype:
+            scratch = self._scratch = np.empty(shape, dtype=dtype)
+        return scratch
+
     @abstractmethod
     def compute(self, base_expression: float, tf_inputs: float) -> float:
         """Compute regulated expression level.
@@ -60,6 +72,32 @@ class RegulatoryExpressionModel(ABC):
         """
         ...
 
+    def compute_batch(
+        self, base_expression: np.ndarray, tf_inputs: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        """Compute regulated expression element-wise over a whole matrix.
+
+        Default applies compute() to each entry; subclasses override with
+        NumPy ufunc paths.
+
+        Parameters
+        ----------
+        base_expression : np.ndarray or float
+            Base expression levels, broadcastable to (n_individuals, n_genes).
+        tf_inputs : np.ndarray or float
+            TF input levels, broadcastable to base_expression.
+        out : np.ndarray
+            Output array (may alias base_expression), overwritten in-place.
+
+        Returns
+        -------
+        np.ndarray
+            The filled ``out`` array (all entries >= 0).
+        """
+        regulated = np.vectorize(self.compute, otypes=[np.float64])
+        out[...] = regulated(base_expression, tf_inputs)
+        return out
+
 
 class AdditiveRegulation(RegulatoryExpressionModel):
     """Additive regulatory model: expr = base + weight*tf_inputs.
@@ -83,6 +121,8 @@ class AdditiveRegulation(RegulatoryExpressionModel):
     0.0  # max(1.0 + (-1.0)*5.0, 0) = max(-4, 0) = 0
     """
 
+    __slots__ = ()
+
     def compute(self, base_expression: float, tf_inputs: float) -> float:
         """Compute additive regulatory effect.
 
@@ -103,6 +143,18 @@ class AdditiveRegulation(RegulatoryExpressionModel):
         result = base_expression + self.weight * tf_inputs
         return max(0.0, result)
 
+    def compute_batch(
+        self, base_expression: np.ndarray, tf_inputs: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized additive effect: out = max(base + weight*tf, 0)."""
+        # weight*tf goes into a reused scratch buffer, not a fresh temporary
+        scaled = np.multiply(
+            tf_inputs, self.weight, out=self._scratch_like(np.shape(tf_inputs), out.dtype)
+        )
+        np.add(base_expression, scaled, out=out)
+        np.maximum(out, 0.0, out=out)
+        return out
+
     def __repr__(self) -> str:
         return f"AdditiveRegulation(weight={self.weight})"
 
@@ -129,6 +181,8 @@ class MultiplicativeRegulation(RegulatoryExpressionModel):
     0.0  # max(10.0 * (1 + (-1.0)*1.0), 0) = max(0, 0) = 0
     """
 
+    __slots__ = ()
+
     def compute(self, base_expression: float, tf_inputs: float) -> float:
         """Compute multiplicative regulatory effect.
 
@@ -150,6 +204,19 @@ class MultiplicativeRegulation(RegulatoryExpressionModel):
         result = base_expression * multiplier
         return max(0.0, result)
 
+    def compute_batch(
+        self, base_expression: np.ndarray, tf_inputs: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized multiplicative effect: out = max(base*(1 + weight*tf), 0)."""
+        # 1 + weight*tf built in a reused scratch buffer, not fresh temporaries
+        multiplier = np.multiply(
+            tf_inputs, self.weight, out=self._scratch_like(np.shape(tf_inputs), out.dtype)
+        )
+        multiplier += 1.0
+        np.multiply(base_expression, multiplier, out=out)
+        np.maximum(out, 0.0, out=out)
+        return out
+
     def __repr__(self) -> str:
         return f"MultiplicativeRegulation(weight={self.weight})"
 
@@ -188,6 +255,8 @@ class CompositeExpressionModel(ExpressionModel):
     >>> outer.compute(conditions, tf_inputs=1.0)
     """
 
+    __slots__ = ('_base_model', '_regulatory_model')
+
     def __init__(
         self, base_model: ExpressionModel, regulatory_model: RegulatoryExpressionModel
     ):
@@ -235,6 +304,40 @@ class CompositeExpressionModel(ExpressionModel):
         base_expr = self._base_model.compute(conditions)
         return self._regulatory_model.compute(base_expr, tf_inputs)
 
+    def compute_batch(
+        self,
+        conditions: Conditions,
+        out: np.ndarray,
+        tf_inputs: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Compute regulated expression for a whole population (vectorized).
+
+        Batch form of compute(): the base level (a scalar for uniform base
+        models, otherwise a filled ``out``) is modulated by the regulatory layer.
+
+        Parameters
+        ----------
+        conditions : Conditions
+            Environmental conditions for base model.
+        out : np.ndarray
+            Expression matrix of shape (n_individuals, n_genes), overwritten in-place.
+        tf_inputs : np.ndarray, optional
+            TF inputs of the same shape as ``out`` (default: 0.0 everywhere).
+
+        Returns
+        -------
+        np.ndarray
+            The filled ``out`` array (all entries >= 0).
+        """
+        if tf_inputs is None:
+            tf_inputs = 0.0
+        # Uniform base models hand over a scalar that broadcasts in the overlay,
+        # saving a fill pass and a read of the filled matrix
+        base_expr = self._base_model.broadcast_level(conditions)
+        if base_expr is None:
+            base_expr = self._base_model.compute_batch(conditions, out)
+        return self._regulatory_model.compute_batch(base_expr, tf_inputs, out)
+
     def __repr__(self) -> str:
         return (
             f"CompositeExpressionModel("
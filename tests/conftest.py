@@ -0,0 +1,12 @@
+"""Shared pytest configuration for the happygene test suite."""
+import gc
+
+
+def pytest_sessionstart(session):
+    """Freeze objects alive at session start out of cyclic GC.
+
+    Pytest plumbing and imported modules live for the whole run; moving them
+    into the permanent generation keeps collections triggered during large
+    simulations from rescanning them.
+    """
+    gc.freeze()
@@ -54,3 +54,12 @@ def test_simulation_model_run_stops_when_not_running():
     model.run(10)
     assert model.generation == 3
     assert call_count[0] == 3
+
+
+def test_simulation_model_rng_built_on_first_access():
+    """The seeded generator is created lazily and then reused."""
+    model = ConcreteModel(seed=42)
+    assert model._rng is None
+    rng = model.rng
+    assert model.rng is rng
+    assert rng.uniform() == ConcreteModel(seed=42).rng.uniform()
@@ -1,5 +1,6 @@
 """Tests for DataCollector (3-tier reporting)."""
 
+import numpy as np
 import pandas as pd
 
 from happygene.datacollector import DataCollector
@@ -243,3 +244,185 @@ class TestDataCollector:
         df = collector.get_model_dataframe()
         # Should only have last 5 rows
         assert len(df) == 5
+
+    def test_datacollector_buffers_grow_and_trim(self):
+        """Rows survive buffer growth, and max_history keeps the newest rows in order."""
+        network = GeneNetwork(
+            individuals=[Individual([Gene("geneA", 1.0), Gene("geneB", 2.0)])],
+            expression_model=LinearExpression(slope=0.0, intercept=1.0),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.0, magnitude=0.0),
+            seed=42,
+        )
+        unlimited = DataCollector(
+            model_reporters={"mean_fitness": lambda m: m.compute_mean_fitness()},
+            gene_reporters={"expression": lambda g: g.expression_level},
+        )
+        trimmed = DataCollector(
+            model_reporters={"generation_copy": lambda m: m.generation}, max_history=7
+        )
+
+        for _ in range(40):
+            unlimited.collect(network)
+            trimmed.collect(network)
+            network.step()
+
+        model_df = unlimited.get_model_dataframe()
+        assert list(model_df["generation"]) == list(range(40))
+        gene_df = unlimited.get_gene_dataframe()
+        assert len(gene_df) == 80
+        assert list(gene_df["gene"][:4]) == ["geneA", "geneB", "geneA", "geneB"]
+        assert list(gene_df["individual"].unique()) == [0]
+
+        trimmed_df = trimmed.get_model_dataframe()
+        assert list(trimmed_df["generation_copy"]) == list(range(33, 40))
+        assert len(trimmed._model_data) == 7
+
+    def test_datacollector_reporter_value_types_preserved(self):
+        """Int reporters promote to float when needed; non-numeric values are kept."""
+        network = GeneNetwork(
+            individuals=[Individual([Gene("geneA", 1.0)])],
+            expression_model=LinearExpression(slope=0.0, intercept=1.0),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.0, magnitude=0.0),
+            seed=42,
+        )
+        values = iter([1, 2.5, 3])
+        collector = DataCollector(
+            model_reporters={"value": lambda m: next(values), "label": lambda m: f"g{m.generation}"}
+        )
+        for _ in range(3):
+            collector.collect(network)
+            network.step()
+
+        df = collector.get_model_dataframe()
+        assert df["value"].dtype == float
+        assert list(df["value"]) == [1.0, 2.5, 3.0]
+        assert list(df["label"]) == ["g0", "g1", "g2"]
+        assert df["generation"].dtype.kind == "i"
+
+    def test_datacollector_attribute_reporters_match_generic_path(self):
+        """attrgetter reporters take the bulk path with identical results."""
+        from operator import attrgetter
+
+        from happygene.datacollector import _reporter_attribute
+
+        assert _reporter_attribute(attrgetter("name")) == "name"
+        assert _reporter_attribute(attrgetter("a.b")) is None
+        assert _reporter_attribute(attrgetter("name", "level")) is None
+        assert _reporter_attribute(lambda g: g.expression_level) is None
+
+        network = GeneNetwork.from_arrays(
+            np.random.default_rng(0).random((6, 4)),
+            gene_names=["a", "b", "c", "d"],
+            expression_model=LinearExpression(slope=1.0, intercept=0.0),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.5, magnitude=0.2),
+            seed=42,
+            dtype=np.float32,
+        )
+        fast = DataCollector(
+            individual_reporters={"fitness": attrgetter("fitness")},
+            gene_reporters={"expr": attrgetter("expression_level"), "name": attrgetter("name")},
+        )
+        slow = DataCollector(
+            individual_reporters={"fitness": lambda i: i.fitness + 0.0},
+            gene_reporters={"expr": lambda g: g.expression_level + 0.0, "name": lambda g: str(g.name)},
+        )
+        for _ in range(3):
+            fast.collect(network)
+            slow.collect(network)
+            network.step()
+
+        pd.testing.assert_frame_equal(fast.get_gene_dataframe(), slow.get_gene_dataframe())
+        pd.testing.assert_frame_equal(
+            fast.get_individual_dataframe(), slow.get_individual_dataframe()
+        )
+
+    def test_datacollector_reporters_added_and_removed_mid_run(self):
+        """Columns added or dropped between collects read as missing, not garbage."""
+        network = GeneNetwork(
+            individuals=[Individual([Gene("geneA", 1.0), Gene("geneB", 2.0)])],
+            expression_model=LinearExpression(slope=0.0, intercept=1.0),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.0, magnitude=0.0),
+            seed=42,
+        )
+        collector = DataCollector(
+            model_reporters={"count": lambda m: 7, "label": lambda m: "x"},
+            gene_reporters={"expression": lambda g: g.expression_level},
+        )
+        for generation in range(4):
+            if generation == 2:
+                del collector.model_reporters["count"]
+                del collector.model_reporters["label"]
+                collector.model_reporters["mean_fitness"] = lambda m: m.compute_mean_fitness()
+                collector.gene_reporters["name"] = lambda g: g.name
+            collector.collect(network)
+            network.step()
+
+        model_df = collector.get_model_dataframe()
+        assert list(model_df["generation"]) == [0, 1, 2, 3]
+        assert list(model_df["count"][:2]) == [7, 7]
+        assert model_df["count"][2:].isna().all()
+        assert model_df["label"][2:].isna().all()
+        assert model_df["mean_fitness"][:2].isna().all()
+        assert model_df["mean_fitness"][2:].notna().all()
+
+        gene_df = collector.get_gene_dataframe()
+        assert gene_df["name"][:4].isna().all()
+        assert list(gene_df["name"][4:]) == ["geneA", "geneB"] * 2
+
+    def test_datacollector_float32_column_promotes_to_float64(self):
+        """A column first seen as float32 widens instead of downcasting later values."""
+        from happygene.datacollector import _ColumnStore
+
+        store = _ColumnStore()
+        store.extend({"value": np.array([0.5], dtype=np.float32)}, 1)
+        store.extend({"value": np.array([0.1])}, 1)
+
+        df = store.to_dataframe()
+        assert df["value"].dtype == np.float64
+        assert df["value"][1] == 0.1
+
+    def test_datacollector_expression_reporter_keeps_history(self):
+        """Individual.expression values recorded earlier do not follow later steps."""
+        network = GeneNetwork(
+            individuals=[Individual([Gene("geneA", 1.0), Gene("geneB", 1.0)])],
+            expression_model=LinearExpression(slope=0.0, intercept=2.0),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.0, magnitude=0.0),
+            seed=42,
+        )
+        collector = DataCollector(individual_reporters={"levels": lambda ind: ind.expression})
+        collector.collect(network)
+        network.step()
+        collector.collect(network)
+
+        levels = collector.get_individual_dataframe()["levels"]
+        np.testing.assert_array_equal(levels[0], [1.0, 1.0])
+        np.testing.assert_array_equal(levels[1], [2.0, 2.0])
+
+    def test_datacollector_trimmed_gaps_restore_reporter_dtype(self):
+        """Once max_history trims the missing rows, columns match the retained rows."""
+        network = GeneNetwork(
+            individuals=[Individual([Gene("geneA", 1.0)])],
+            expression_model=LinearExpression(slope=0.0, intercept=1.0),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.0, magnitude=0.0),
+            seed=42,
+        )
+        collector = DataCollector(model_reporters={"old": lambda m: 1.5}, max_history=2)
+        for generation in range(5):
+            if generation == 2:
+                del collector.model_reporters["old"]
+                collector.model_reporters["count"] = lambda m: m.generation * 10
+                collector.model_reporters["flag"] = lambda m: True
+            collector.collect(network)
+            network.step()
+
+        df = collector.get_model_dataframe()
+        assert list(df.columns) == ["generation", "count", "flag"]
+        assert df["count"].dtype == np.int64
+        assert list(df["count"]) == [30, 40]
+        assert df["flag"].dtype == bool
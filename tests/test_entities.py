@@ -1,6 +1,7 @@
 """Tests for Gene and Individual entities."""
 import sys
 import pytest
+import numpy as np
 from happygene.entities import Gene, Individual
 
 
@@ -73,6 +74,60 @@ class TestIndividual:
         ind = Individual(genes=genes)
         assert ind.mean_expression() == 20.0 / 3.0
 
+    def test_individual_from_row(self):
+        """Individual.from_row builds named genes from one row of a population array."""
+        population = np.array([[1.5, -0.5, 2.0], [0.0, 3.0, 1.0]])
+        ind = Individual.from_row(["a", "b", "c"], population[0])
+        assert [g.name for g in ind.genes] == ["a", "b", "c"]
+        assert [g.expression_level for g in ind.genes] == [1.5, 0.0, 2.0]
+        assert all(type(g.expression_level) is float for g in ind.genes)
+        assert ind.fitness == 1.0
+
+    def test_gene_names_are_interned(self):
+        """Genes built from equal but distinct name strings share one object."""
+        first = Gene("".join(["G", "42"]), 1.0)
+        second = Gene("".join(["G", "42"]), 2.0)
+        assert first.name is second.name
+
+    def test_gene_accepts_numpy_string_names(self):
+        """Names that are not exact str (e.g. from a NumPy array) are kept as given."""
+        gene = Gene(np.str_("a"), 1.0)
+        ind = Individual.from_row(np.array(["a", "b"]), [1.0, 2.0])
+        bulk = Gene.bulk(np.array(["a"]), [1.0])
+
+        assert gene.name == "a"
+        assert [g.name for g in ind.genes] == ["a", "b"]
+        assert bulk[0].name == "a"
+
+    def test_gene_bulk_matches_individual_construction(self):
+        """Gene.bulk builds the same standalone genes as one Gene() call each."""
+        names = ["a", "b", "c"]
+        levels = np.array([1.5, -2.0, 0.0])
+        genes = Gene.bulk(names, levels)
+
+        assert [g.name for g in genes] == names
+        assert [g.expression_level for g in genes] == [1.5, 0.0, 0.0]
+        assert all(g._row is None for g in genes)
+        with pytest.raises(ValueError):
+            Gene.bulk(names, [1.0])
+
+    def test_individual_from_row_genes_share_one_row(self):
+        """Genes built by from_row view one clamped row; expression is a snapshot of it."""
+        ind = Individual.from_row(["a", "b", "c"], [1.0, -2.0, 3.0])
+        assert all(gene._row is ind.genes[0]._row for gene in ind.genes)
+        snapshot = ind.expression
+        np.testing.assert_array_equal(snapshot, [1.0, 0.0, 3.0])
+        snapshot[1] = -5.0
+        assert ind.genes[1].expression_level == 0.0
+        ind.genes[2]._assign(7.0)
+        assert snapshot[2] == 3.0
+        np.testing.assert_array_equal(ind.expression, [1.0, 0.0, 7.0])
+
+    def test_individual_from_row_length_mismatch(self):
+        """Individual.from_row rejects rows that do not match the gene names."""
+        with pytest.raises(ValueError):
+            Individual.from_row(["a", "b"], [1.0, 2.0, 3.0])
+
 
 class TestMemoryOptimization:
     """Tests for memory usage before and after __slots__ optimization."""
@@ -111,7 +166,7 @@ class TestMemoryOptimization:
         """Individual class has __slots__ defined."""
         assert hasattr(Individual, '__slots__')
         assert 'genes' in Individual.__slots__
-        assert 'fitness' in Individual.__slots__
+        assert '_fitness' in Individual.__slots__
 
     def test_individual_no_dict_after_slots(self):
         """Individual instances do not have __dict__ after __slots__ optimization."""
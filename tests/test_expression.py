@@ -1,5 +1,6 @@
 """Tests for expression models and conditions."""
 
+import numpy as np
 import pytest
 
 from happygene.conditions import Conditions
@@ -99,6 +100,15 @@ class TestLinearExpression:
         with pytest.raises(ValueError):
             LinearExpression(slope=1.0, intercept=-1.0)
 
+    def test_linear_expression_compute_batch_broadcasts_compute(self):
+        """Default compute_batch() broadcasts the clamped scalar result."""
+        expr = LinearExpression(slope=-2.0, intercept=1.0)
+        out = np.empty((2, 5))
+        expr.compute_batch(Conditions(tf_concentration=0.25), out)
+        assert np.all(out == 0.5)
+        expr.compute_batch(Conditions(tf_concentration=3.0), out)
+        assert np.all(out == 0.0)
+
     def test_linear_expression_repr(self):
         """LinearExpression has informative repr."""
         expr = LinearExpression(slope=2.0, intercept=1.0)
@@ -141,6 +151,14 @@ class TestConstantExpression:
         with pytest.raises(ValueError):
             ConstantExpression(level=-1.0)
 
+    def test_constant_expression_compute_batch_fills_level(self):
+        """compute_batch() fills the whole matrix with the fixed level."""
+        expr = ConstantExpression(level=2.5)
+        out = np.full((4, 3), -1.0)
+        result = expr.compute_batch(Conditions(tf_concentration=7.0), out)
+        assert result is out
+        assert np.all(out == 2.5)
+
     def test_constant_expression_repr(self):
         """ConstantExpression has informative repr."""
         expr = ConstantExpression(level=5.0)
@@ -182,6 +200,15 @@ class TestHillExpression:
         # At tf=k: result = v_max * (k^n) / (k^n + k^n) = v_max / 2
         assert abs(result - 5.0) < 0.01
 
+    def test_hill_expression_tracks_updated_parameters(self):
+        """The cached k**n follows later changes to k and n; no per-instance __dict__."""
+        expr = HillExpression(v_max=10.0, k=2.0, n=2.0)
+        expr.k = 1.0
+        assert expr.compute(Conditions(tf_concentration=1.0)) == pytest.approx(5.0)
+        expr.n = 3.0
+        assert expr.compute(Conditions(tf_concentration=2.0)) == pytest.approx(80.0 / 9.0)
+        assert not hasattr(expr, "__dict__")
+
     def test_hill_expression_cooperativity(self):
         """HillExpression with n=4 is more switch-like than n=1."""
         expr_steep = HillExpression(v_max=10.0, k=2.0, n=4.0)
@@ -218,3 +245,31 @@ class TestHillExpression:
         expr = HillExpression(v_max=10.0, k=2.0, n=2.0)
         repr_str = repr(expr)
         assert "HillExpression" in repr_str
+
+
+class TestBroadcastLevel:
+    """Tests for ExpressionModel.broadcast_level()."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            LinearExpression(slope=-0.5, intercept=1.0),
+            ConstantExpression(level=2.0),
+            HillExpression(v_max=4.0, k=1.0, n=2.0),
+        ],
+    )
+    def test_broadcast_level_matches_compute_batch(self, model):
+        """Uniform models report the value compute_batch() writes everywhere."""
+        for tf in (0.0, 0.7, 5.0):
+            conditions = Conditions(tf_concentration=tf)
+            out = model.compute_batch(conditions, np.empty((3, 2)))
+            assert np.all(out == model.broadcast_level(conditions))
+
+    def test_broadcast_level_defaults_to_none(self):
+        """Models that do not opt in report no uniform level."""
+
+        class NoisyExpression(ExpressionModel):
+            def compute(self, conditions):
+                return 1.0
+
+        assert NoisyExpression().broadcast_level(Conditions()) is None
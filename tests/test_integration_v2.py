@@ -137,10 +137,10 @@ class TestMultiObjectiveSelectionLargePopulation:
         # Setup: 100 individuals × 5 genes
         n_individuals = 100
         n_genes = 5
+        gene_names = [f"g{j}" for j in range(n_genes)]
         individuals = [
-            Individual(genes=[Gene(f"g{j}", np.random.uniform(0.5, 1.5))
-                            for j in range(n_genes)])
-            for _ in range(n_individuals)
+            Individual.from_row(gene_names, row)
+            for row in np.random.default_rng(42).uniform(0.5, 1.5, size=(n_individuals, n_genes))
         ]
 
         # Multi-objective selection: 5 objectives with equal weights
@@ -300,10 +300,10 @@ class TestDataCollectorWithThresholdSelection:
         Covers model.py:120-124 (non-ProportionalSelection else branch).
         """
         # Setup: 3-gene population
+        gene_names = [f"g{j}" for j in range(3)]
         individuals = [
-            Individual(genes=[Gene(f"g{j}", np.random.uniform(0.5, 1.5))
-                            for j in range(3)])
-            for _ in range(5)
+            Individual.from_row(gene_names, row)
+            for row in np.random.default_rng(42).uniform(0.5, 1.5, size=(5, 3))
         ]
 
         # ThresholdSelection
@@ -1,4 +1,7 @@
 """Tests for GeneNetwork model."""
+import os
+from operator import attrgetter, methodcaller
+
 import pytest
 import numpy as np
 from happygene.base import SimulationModel
@@ -11,169 +14,207 @@ from happygene.selection import ProportionalSelection, ThresholdSelection
 from happygene.mutation import PointMutation
 from happygene.conditions import Conditions
 
+# cProfile adds tracer overhead to every call, so step profiling is opt-in:
+# HAPPYGENE_PROFILE=1 pytest tests/test_model.py -k profile -s
+PROFILE_STEP = os.environ.get("HAPPYGENE_PROFILE") == "1"
+
+
+@pytest.fixture(scope="session")
+def models():
+    """Shared identity expression, proportional selection and no-op mutation.
+
+    The models keep no per-test state (PointMutation's scratch buffers are
+    resized per call), so one instance serves the whole session, or each
+    pytest-xdist worker.
+    """
+    return (
+        LinearExpression(slope=1.0, intercept=0.0),
+        ProportionalSelection(),
+        PointMutation(rate=0.0, magnitude=0.0),
+    )
+
+
+@pytest.fixture(scope="module")
+def large_model():
+    """100 × 50 network with mutation, built once for the step benchmark."""
+    n_individuals, n_genes = 100, 50
+    return GeneNetwork.from_arrays(
+        np.random.default_rng(42).uniform(0.5, 2.0, size=(n_individuals, n_genes)),
+        [f"G{j}" for j in range(n_genes)],
+        expression_model=LinearExpression(slope=1.5, intercept=0.2),
+        selection_model=ProportionalSelection(),
+        mutation_model=PointMutation(rate=0.1, magnitude=0.1),
+        seed=42,
+    )
+
+
+@pytest.fixture
+def rng():
+    """Freshly seeded generator for drawing initial expression matrices."""
+    return np.random.default_rng(42)
+
+
+@pytest.fixture
+def make_model(models):
+    """Factory for a GeneNetwork over the shared models (fresh per call).
+
+    Only the network, which owns the mutable population state, is rebuilt;
+    pass expression_model to override the shared identity expression.
+    """
+    expr_model, select_model, mutate_model = models
+
+    def make(individuals, expression_model=None, regulatory_network=None, seed=42):
+        return GeneNetwork(
+            individuals=individuals,
+            expression_model=expression_model or expr_model,
+            selection_model=select_model,
+            mutation_model=mutate_model,
+            seed=seed,
+            regulatory_network=regulatory_network,
+        )
+
+    return make
+
+
+def _with_fitness(individuals, fitness):
+    """Set each individual's fitness before it joins a network."""
+    for individual, value in zip(individuals, fitness):
+        individual.fitness = value
+    return individuals
+
 
 class TestGeneNetwork:
     """Tests for GeneNetwork simulation model."""
 
-    def test_gene_network_creation(self):
+    def test_gene_network_creation(self, make_model):
         """GeneNetwork can be instantiated as a concrete SimulationModel."""
-        individuals = [Individual(genes=[Gene("A", 2.0)])]
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42,
-        )
+        model = make_model(individuals=[Individual(genes=[Gene("A", 2.0)])])
         assert isinstance(model, SimulationModel)
-        assert model.generation == 0
-
-    def test_gene_network_has_individuals(self):
-        """GeneNetwork stores and retrieves individuals."""
-        genes1 = [Gene("A", 1.0), Gene("B", 2.0)]
-        genes2 = [Gene("A", 3.0), Gene("B", 4.0)]
-        individuals = [Individual(genes=genes1), Individual(genes=genes2)]
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42,
-        )
-        assert len(model.individuals) == 2
-        assert model.individuals[0].mean_expression() == 1.5
 
-    def test_gene_network_compute_mean_fitness(self):
-        """compute_mean_fitness() returns average fitness across individuals."""
-        individuals = [Individual(genes=[]), Individual(genes=[])]
-        individuals[0].fitness = 1.0
-        individuals[1].fitness = 3.0
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42,
-        )
-        assert model.compute_mean_fitness() == 2.0
-
-    def test_gene_network_compute_mean_fitness_empty(self):
-        """compute_mean_fitness() returns 0.0 for empty population."""
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=[],
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42,
+    @pytest.mark.parametrize(
+        "make_individuals, read, expected",
+        [
+            (lambda: [Individual(genes=[Gene("A", 2.0)])], attrgetter("generation"), 0),
+            (
+                lambda: [
+                    Individual(genes=[Gene("A", 1.0), Gene("B", 2.0)]),
+                    Individual(genes=[Gene("A", 3.0), Gene("B", 4.0)]),
+                ],
+                lambda model: (len(model.individuals), model.individuals[0].mean_expression()),
+                (2, 1.5),
+            ),
+            (
+                lambda: _with_fitness([Individual(genes=[]), Individual(genes=[])], [1.0, 3.0]),
+                methodcaller("compute_mean_fitness"),
+                2.0,
+            ),
+            (lambda: [], methodcaller("compute_mean_fitness"), 0.0),
+            (lambda: [Individual(genes=[Gene("A", 1.0)])], attrgetter("regulatory_network"), None),
+        ],
+        ids=["generation", "individuals", "mean_fitness", "mean_fitness_empty", "no_regulation"],
+    )
+    def test_gene_network_basic_properties(self, make_model, make_individuals, read, expected):
+        """A freshly built network reports its initial state."""
+        model = make_model(individuals=make_individuals())
+        assert read(model) == expected
+
+    def test_gene_network_compute_mean_expression(self, make_model):
+        """compute_mean_expression() matches Individual.mean_expression() per row."""
+        individuals = [
+            Individual.from_row(["A", "B", "C"], [1.0, 2.0, 6.0]),
+            Individual.from_row(["A", "B", "C"], [0.0, 0.5, 1.0]),
+        ]
+        model = make_model(individuals=individuals)
+        np.testing.assert_allclose(
+            model.compute_mean_expression(), [ind.mean_expression() for ind in individuals]
         )
-        assert model.compute_mean_fitness() == 0.0
+        assert make_model(individuals=[Individual(genes=[])]).compute_mean_expression() == [0.0]
 
-    def test_gene_network_step_increments_generation(self):
-        """Calling step() advances generation counter."""
-        individuals = [Individual(genes=[])]
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42,
-        )
-        assert model.generation == 0
+    def test_gene_network_fitness_backed_by_population_array(self, make_model):
+        """Individual fitness reads and writes the network's fitness array."""
+        individuals = [Individual([Gene("g0", 1.0)]), Individual([Gene("g0", 4.0)])]
+        model = make_model(individuals=individuals)
         model.step()
-        assert model.generation == 1
-
-    def test_gene_network_empty_step(self):
-        """step() works even with empty population."""
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=[],
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42,
-        )
+        np.testing.assert_array_equal(
+            model._fitness, [ind.fitness for ind in model.individuals]
+        )
+        individuals[1].fitness = 0.25
+        assert model._fitness[1] == 0.25
+        assert Individual([]).fitness == 1.0
+
+    @pytest.mark.parametrize(
+        "individuals",
+        [[], [Individual(genes=[])]],
+        ids=["empty", "no_genes"],
+    )
+    def test_gene_network_step_increments_generation(self, make_model, individuals):
+        """Calling step() advances the generation counter, even with no one to evolve."""
+        model = make_model(individuals=individuals)
         model.step()
         assert model.generation == 1
 
-    def test_gene_network_has_rng(self):
+    def test_gene_network_has_rng(self, make_model):
         """GeneNetwork has reproducible random number generator."""
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-        model = GeneNetwork(
-            individuals=[],
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=123,
-        )
+        model = make_model(individuals=[], seed=123)
         val1 = model.rng.uniform()
 
-        model2 = GeneNetwork(
-            individuals=[],
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=123,
-        )
+        model2 = make_model(individuals=[], seed=123)
         val2 = model2.rng.uniform()
 
         assert val1 == val2
 
-    def test_gene_network_optional_regulatory_network(self):
-        """GeneNetwork accepts optional regulatory_network parameter defaulting to None."""
+    def test_gene_network_optional_regulatory_network(self, make_model):
+        """GeneNetwork exposes the regulatory_network it was given."""
         individuals = [Individual(genes=[Gene("A", 1.0)])]
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        # Without regulatory_network
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42
-        )
-        assert model.regulatory_network is None
-
-        # With regulatory_network
         reg_net = RegulatoryNetwork(
             gene_names=["A"],
             interactions=[]
         )
-        model2 = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
+        model = make_model(individuals=individuals, regulatory_network=reg_net)
+        assert model.regulatory_network is reg_net
+
+    def test_gene_network_regulated_step_reuses_scratch_buffers(self):
+        """Regulated steps keep their TF and overlay buffers, allocating no matrix per step."""
+        import tracemalloc
+
+        n_indiv, n_genes = 200, 20
+        gene_names = [f"G{j}" for j in range(n_genes)]
+        reg_net = RegulatoryNetwork(
+            gene_names=gene_names,
+            interactions=[
+                RegulationConnection(source=a, target=b, weight=0.5)
+                for a, b in zip(gene_names, gene_names[1:])
+            ],
+        )
+        regulatory_model = AdditiveRegulation(weight=0.1)
+        model = GeneNetwork.from_arrays(
+            np.random.default_rng(0).uniform(0.5, 2.0, size=(n_indiv, n_genes)),
+            gene_names,
+            expression_model=CompositeExpressionModel(
+                ConstantExpression(level=0.5), regulatory_model
+            ),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.1, magnitude=0.05),
             regulatory_network=reg_net,
-            seed=42
+            seed=42,
         )
-        assert model2.regulatory_network is reg_net
+        model.step()
+        tf_buffer = model._tf_matrix
+        overlay_buffer = regulatory_model._scratch
+
+        tracemalloc.start()
+        model.run(10)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
 
-    def test_gene_network_step_with_regulation(self):
+        assert model._tf_matrix is tf_buffer
+        assert regulatory_model._scratch is overlay_buffer
+        assert peak_bytes < model._expr.nbytes
+
+    def test_gene_network_step_with_regulation(self, make_model):
         """GeneNetwork.step() integrates TF inputs when regulatory_network provided."""
         # Setup: 2 genes where gene B is activated by gene A
-        genes = [Gene("A", 1.0), Gene("B", 2.0)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B"], [1.0, 2.0])
         individuals = [individual]
 
         # Create regulatory network: A -> B with weight 1.0
@@ -187,16 +228,10 @@ class TestGeneNetwork:
         regulatory_model = AdditiveRegulation(weight=1.0)
         composite_expr = CompositeExpressionModel(base_model, regulatory_model)
 
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
+        model = make_model(
             individuals=individuals,
             expression_model=composite_expr,
-            selection_model=select_model,
-            mutation_model=mutate_model,
             regulatory_network=reg_net,
-            seed=42
         )
 
         # Before step, gene B has expression 2.0
@@ -206,58 +241,37 @@ class TestGeneNetwork:
 
         # After step with regulation: A=0.5 (base), B = 0.5 (base) + 1.0*(1.0 tf input) = 1.5
         # (tf input for B = 1.0 * A's old expression = 1.0)
-        assert individual.genes[0].expression_level == 0.5
-        assert individual.genes[1].expression_level == 1.5
+        np.testing.assert_allclose(model.expression_matrix, [[0.5, 1.5]])
 
-    def test_gene_network_backwards_compatible(self):
+    def test_gene_network_backwards_compatible(self, make_model):
         """Phase 1 examples work unchanged without regulatory_network."""
         # Traditional setup without regulation
-        genes = [Gene("A", 1.0), Gene("B", 2.0)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B"], [1.0, 2.0])
         individuals = [individual]
 
         # Simple linear expression (no regulation)
         expr_model = LinearExpression(slope=1.0, intercept=1.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
 
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42
-        )
+        model = make_model(individuals=individuals, expression_model=expr_model)
 
         initial_mean = individual.mean_expression()
         model.step()
 
         # Should still compute expression from conditions (default tf_concentration=0.0)
         # expr = 1.0 * 0.0 + 1.0 = 1.0 for all genes
-        assert individual.genes[0].expression_level == 1.0
-        assert individual.genes[1].expression_level == 1.0
+        np.testing.assert_allclose(model.expression_matrix, [[1.0, 1.0]])
         assert model.generation == 1
 
-    def test_gene_network_regulatory_network_immutable_after_init(self):
+    def test_gene_network_regulatory_network_immutable_after_init(self, make_model):
         """Regulatory network cannot be changed after initialization."""
         individuals = [Individual(genes=[Gene("A", 1.0)])]
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
 
         reg_net1 = RegulatoryNetwork(
             gene_names=["A"],
             interactions=[]
         )
 
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            regulatory_network=reg_net1,
-            seed=42
-        )
+        model = make_model(individuals=individuals, regulatory_network=reg_net1)
 
         # Attempt to modify (property setter should prevent or handle gracefully)
         # This test documents expected behavior: None or raise on attempted mutation
@@ -271,10 +285,9 @@ class TestGeneNetwork:
         # After assignment, verify it's the new one (mutable property)
         assert model.regulatory_network is reg_net2
 
-    def test_gene_network_step_expression_clamped(self):
+    def test_gene_network_step_expression_clamped(self, make_model):
         """Expression levels are clamped to [0, inf) even with regulation."""
-        genes = [Gene("A", 1.0), Gene("B", 1.0)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B"], [1.0, 1.0])
         individuals = [individual]
 
         # Regulatory network: strong repression from A to B
@@ -288,16 +301,10 @@ class TestGeneNetwork:
         regulatory_model = AdditiveRegulation(weight=1.0)
         composite_expr = CompositeExpressionModel(base_model, regulatory_model)
 
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
+        model = make_model(
             individuals=individuals,
             expression_model=composite_expr,
-            selection_model=select_model,
-            mutation_model=mutate_model,
             regulatory_network=reg_net,
-            seed=42
         )
 
         model.step()
@@ -305,12 +312,13 @@ class TestGeneNetwork:
         # B's expression should be clamped to 0 (1.0 + 1.0*(-10.0) = -9.0 -> 0.0)
         assert individual.genes[1].expression_level == 0.0
 
-    def test_gene_network_multiple_individuals_regulation(self):
+    def test_gene_network_multiple_individuals_regulation(self, make_model):
         """Regulation works correctly across multiple individuals in population."""
         # 2 individuals, 2 genes each
-        ind1_genes = [Gene("A", 1.0), Gene("B", 0.5)]
-        ind2_genes = [Gene("A", 2.0), Gene("B", 0.5)]
-        individuals = [Individual(genes=ind1_genes), Individual(genes=ind2_genes)]
+        individuals = [
+            Individual.from_row(["A", "B"], [1.0, 0.5]),
+            Individual.from_row(["A", "B"], [2.0, 0.5]),
+        ]
 
         # A -> B with weight 2.0
         reg_net = RegulatoryNetwork(
@@ -322,29 +330,19 @@ class TestGeneNetwork:
         regulatory_model = AdditiveRegulation(weight=1.0)
         composite_expr = CompositeExpressionModel(base_model, regulatory_model)
 
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
+        model = make_model(
             individuals=individuals,
             expression_model=composite_expr,
-            selection_model=select_model,
-            mutation_model=mutate_model,
             regulatory_network=reg_net,
-            seed=42
         )
 
         model.step()
 
         # ind1: A=0.5, B = 0.5 + 1.0*2.0*1.0 = 2.5
-        assert individuals[0].genes[0].expression_level == 0.5
-        assert individuals[0].genes[1].expression_level == 2.5
-
         # ind2: A=0.5, B = 0.5 + 1.0*2.0*2.0 = 4.5
-        assert individuals[1].genes[0].expression_level == 0.5
-        assert individuals[1].genes[1].expression_level == 4.5
+        np.testing.assert_allclose(model.expression_matrix, [[0.5, 2.5], [0.5, 4.5]])
 
-    def test_gene_network_regulatory_network_with_cycles_allowed(self):
+    def test_gene_network_regulatory_network_with_cycles_allowed(self, make_model):
         """GeneNetwork permits cycles in regulatory_network (acyclic check optional)."""
         # Create cyclic network: A <-> B
         reg_net = RegulatoryNetwork(
@@ -357,27 +355,16 @@ class TestGeneNetwork:
         )
 
         individuals = [Individual(genes=[Gene("A", 1.0), Gene("B", 1.0)])]
-        expr_model = LinearExpression(slope=1.0, intercept=0.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
 
         # Should initialize without error
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            regulatory_network=reg_net,
-            seed=42
-        )
+        model = make_model(individuals=individuals, regulatory_network=reg_net)
 
         assert model.regulatory_network is reg_net
         assert not model.regulatory_network.is_acyclic  # Verify it has cycles
 
-    def test_gene_network_regulation_with_threshold_selection(self):
+    def test_gene_network_regulation_with_threshold_selection(self, models):
         """Regulation integrates with ThresholdSelection for binary fitness."""
-        genes = [Gene("A", 1.0), Gene("B", 0.5)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B"], [1.0, 0.5])
         individuals = [individual]
 
         # A -> B activation
@@ -392,7 +379,7 @@ class TestGeneNetwork:
 
         # Threshold = 2.0 (passed gene A's expr but not B initially)
         select_model = ThresholdSelection(threshold=2.0)
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
+        _, _, mutate_model = models
 
         model = GeneNetwork(
             individuals=individuals,
@@ -411,8 +398,7 @@ class TestGeneNetwork:
 
     def test_gene_network_run_with_regulatory_network(self):
         """Full 100-generation simulation with regulation runs without error."""
-        genes = [Gene("A", 1.0), Gene("B", 0.5), Gene("C", 0.3)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B", "C"], [1.0, 0.5, 0.3])
         individuals = [individual]
 
         # A -> B, B -> C (feedforward)
@@ -440,9 +426,7 @@ class TestGeneNetwork:
             seed=42
         )
 
-        # Run 100 generations
-        for _ in range(100):
-            model.step()
+        model.run(100)
 
         assert model.generation == 100
         # Verify individual still has valid expression levels
@@ -450,10 +434,9 @@ class TestGeneNetwork:
             assert gene.expression_level >= 0.0
             assert np.isfinite(gene.expression_level)
 
-    def test_gene_network_regulation_with_empty_adjacency(self):
+    def test_gene_network_regulation_with_empty_adjacency(self, make_model):
         """Regulation with network that has no interactions (empty adjacency)."""
-        genes = [Gene("A", 1.0), Gene("B", 1.0)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B"], [1.0, 1.0])
         individuals = [individual]
 
         # No interactions (empty adjacency matrix)
@@ -466,52 +449,28 @@ class TestGeneNetwork:
         regulatory_model = AdditiveRegulation(weight=1.0)
         composite_expr = CompositeExpressionModel(base_model, regulatory_model)
 
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
+        model = make_model(
             individuals=individuals,
             expression_model=composite_expr,
-            selection_model=select_model,
-            mutation_model=mutate_model,
             regulatory_network=reg_net,
-            seed=42
         )
 
         model.step()
 
         # TF inputs should all be zero, so expr = 1.0 + 1.0*0.0 = 1.0
-        assert individual.genes[0].expression_level == 1.0
-        assert individual.genes[1].expression_level == 1.0
+        np.testing.assert_allclose(model.expression_matrix, [[1.0, 1.0]])
 
-    def test_gene_network_vectorized_step_correctness(self):
+    def test_gene_network_vectorized_step_correctness(self, make_model):
         """Vectorized step() produces identical results to non-vectorized version."""
         # Create two identical models with same genes and parameters
-        genes1 = [Gene("A", 1.0), Gene("B", 2.0), Gene("C", 1.5)]
-        individuals1 = [Individual(genes=genes1)]
-
-        genes2 = [Gene("A", 1.0), Gene("B", 2.0), Gene("C", 1.5)]
-        individuals2 = [Individual(genes=genes2)]
+        individuals1 = [Individual.from_row(["A", "B", "C"], [1.0, 2.0, 1.5])]
+        individuals2 = [Individual.from_row(["A", "B", "C"], [1.0, 2.0, 1.5])]
 
         expr_model = LinearExpression(slope=2.0, intercept=0.5)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
 
-        model1 = GeneNetwork(
-            individuals=individuals1,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42
-        )
+        model1 = make_model(individuals=individuals1, expression_model=expr_model)
 
-        model2 = GeneNetwork(
-            individuals=individuals2,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42
-        )
+        model2 = make_model(individuals=individuals2, expression_model=expr_model)
 
         # Run both models for 3 generations
         for _ in range(3):
@@ -522,27 +481,20 @@ class TestGeneNetwork:
         for i, gene in enumerate(individuals1[0].genes):
             assert abs(gene.expression_level - individuals2[0].genes[i].expression_level) < 1e-10
 
-    def test_gene_network_vectorized_large_population(self):
+    def test_gene_network_vectorized_large_population(self, models, rng):
         """Vectorized step() handles large population (100 individuals) correctly."""
         n_individuals = 100
         n_genes = 10
+        _, select_model, mutate_model = models
 
-        # Create large population
-        individuals = [
-            Individual(genes=[Gene(f"G{j}", np.random.uniform(0.5, 2.0)) for j in range(n_genes)])
-            for _ in range(n_individuals)
-        ]
-
-        expr_model = LinearExpression(slope=1.5, intercept=0.2)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
+        # Create large population directly from one expression matrix
+        model = GeneNetwork.from_arrays(
+            rng.uniform(0.5, 2.0, size=(n_individuals, n_genes)),
+            [f"G{j}" for j in range(n_genes)],
+            expression_model=LinearExpression(slope=1.5, intercept=0.2),
             selection_model=select_model,
             mutation_model=mutate_model,
-            seed=42
+            seed=42,
         )
 
         # Execute step - should not crash and maintain population size
@@ -553,27 +505,20 @@ class TestGeneNetwork:
         # All expression levels should be non-negative (clamped)
         assert all(g.expression_level >= 0.0 for ind in model.individuals for g in ind.genes)
 
-    def test_gene_network_vectorized_many_genes(self):
+    def test_gene_network_vectorized_many_genes(self, models, rng):
         """Vectorized step() handles many genes (50 genes) correctly."""
         n_individuals = 10
         n_genes = 50
+        _, select_model, mutate_model = models
 
-        # Create population with many genes
-        individuals = [
-            Individual(genes=[Gene(f"G{j}", np.random.uniform(0.5, 2.0)) for j in range(n_genes)])
-            for _ in range(n_individuals)
-        ]
-
-        expr_model = ConstantExpression(level=1.0)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
+        # Create population with many genes directly from one expression matrix
+        model = GeneNetwork.from_arrays(
+            rng.uniform(0.5, 2.0, size=(n_individuals, n_genes)),
+            [f"G{j}" for j in range(n_genes)],
+            expression_model=ConstantExpression(level=1.0),
             selection_model=select_model,
             mutation_model=mutate_model,
-            seed=42
+            seed=42,
         )
 
         # Execute step
@@ -586,44 +531,21 @@ class TestGeneNetwork:
             for g in ind.genes
         )
 
-    def test_gene_network_vectorized_performance_100_indiv(self):
+    @pytest.mark.xdist_group(name="gene_network")
+    @pytest.mark.benchmark(group="gene-network-step")
+    def test_gene_network_vectorized_performance_100_indiv(self, benchmark, large_model):
         """Vectorized step() executes large simulation in <500ms for 100 indiv × 50 genes."""
-        import time
+        benchmark(large_model.step)
 
-        n_individuals = 100
-        n_genes = 50
+        # Must complete in under 500ms (stats are None under --benchmark-disable)
+        if benchmark.stats is not None:
+            slowest_ms = benchmark.stats.stats.max * 1000
+            assert slowest_ms < 500.0, f"Step took {slowest_ms:.1f}ms, target <500ms"
 
-        # Create large population with many genes
-        individuals = [
-            Individual(genes=[Gene(f"G{j}", np.random.uniform(0.5, 2.0)) for j in range(n_genes)])
-            for _ in range(n_individuals)
-        ]
-
-        expr_model = LinearExpression(slope=1.5, intercept=0.2)
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.1, magnitude=0.1)
-
-        model = GeneNetwork(
-            individuals=individuals,
-            expression_model=expr_model,
-            selection_model=select_model,
-            mutation_model=mutate_model,
-            seed=42
-        )
-
-        # Time a single step with selection and mutation
-        start = time.perf_counter()
-        model.step()
-        elapsed_ms = (time.perf_counter() - start) * 1000
-
-        # Must complete in under 500ms
-        assert elapsed_ms < 500.0, f"Step took {elapsed_ms:.1f}ms, target <500ms"
-
-    def test_gene_network_vectorized_matches_single_computation(self):
+    def test_gene_network_vectorized_matches_single_computation(self, make_model):
         """Vectorized computation with regulation matches expected phenotypes."""
         # Setup: simple 2-gene system with regulation
-        genes = [Gene("A", 1.0), Gene("B", 2.0)]
-        individual = Individual(genes=genes)
+        individual = Individual.from_row(["A", "B"], [1.0, 2.0])
         individuals = [individual]
 
         # A -> B with weight 1.0
@@ -637,16 +559,10 @@ class TestGeneNetwork:
         regulatory_model = AdditiveRegulation(weight=1.0)
         composite_expr = CompositeExpressionModel(base_model, regulatory_model)
 
-        select_model = ProportionalSelection()
-        mutate_model = PointMutation(rate=0.0, magnitude=0.0)
-
-        model = GeneNetwork(
+        model = make_model(
             individuals=individuals,
             expression_model=composite_expr,
-            selection_model=select_model,
-            mutation_model=mutate_model,
             regulatory_network=reg_net,
-            seed=42
         )
 
         # After one step:
@@ -654,10 +570,11 @@ class TestGeneNetwork:
         # B = base + weight*tf_input = 0.5 + 1.0*(1.0) = 1.5
         model.step()
 
-        assert abs(individual.genes[0].expression_level - 0.5) < 1e-10
-        assert abs(individual.genes[1].expression_level - 1.5) < 1e-10
+        np.testing.assert_allclose(model.expression_matrix, [[0.5, 1.5]], atol=1e-10)
 
-    def test_gene_network_profile_step_execution(self):
+    @pytest.mark.xdist_group(name="gene_network")
+    @pytest.mark.skipif(not PROFILE_STEP, reason="set HAPPYGENE_PROFILE=1 to profile step()")
+    def test_gene_network_profile_step_execution(self, rng):
         """Profile GeneNetwork.step() to identify performance bottlenecks.
 
         Captures cProfile output for medium-scale scenario (5k indiv × 50 genes × 1 gen)
@@ -670,17 +587,11 @@ class TestGeneNetwork:
         """
         import cProfile
         import pstats
-        import io
 
         # Create medium-scale scenario for profiling
         n_individuals = 5000
         n_genes = 50
 
-        individuals = [
-            Individual(genes=[Gene(f"G{j}", np.random.uniform(0.5, 1.5)) for j in range(n_genes)])
-            for _ in range(n_individuals)
-        ]
-
         expr_model = LinearExpression(slope=1.0, intercept=0.1)
         select_model = ProportionalSelection()
         mutate_model = PointMutation(rate=0.1, magnitude=0.05)
@@ -688,8 +599,9 @@ class TestGeneNetwork:
         # Create regulatory network for profiling (optional, can be None)
         regulatory_network = None
 
-        model = GeneNetwork(
-            individuals=individuals,
+        model = GeneNetwork.from_arrays(
+            rng.uniform(0.5, 1.5, size=(n_individuals, n_genes)),
+            [f"G{j}" for j in range(n_genes)],
             expression_model=expr_model,
             selection_model=select_model,
             mutation_model=mutate_model,
@@ -697,7 +609,8 @@ class TestGeneNetwork:
             seed=42
         )
 
-        # Profile the step function
+        # Profile a warm step (buffers already allocated by a first step)
+        model.step()
         profiler = cProfile.Profile()
         profiler.enable()
 
@@ -705,23 +618,333 @@ class TestGeneNetwork:
 
         profiler.disable()
 
-        # Capture profile stats to string
-        s = io.StringIO()
-        stats = pstats.Stats(profiler, stream=s)
-        stats.sort_stats('cumulative')
-        stats.print_stats(10)  # Top 10 functions
-
-        profile_output = s.getvalue()
-
-        # Assert that profiling completed and produced output
-        assert profile_output is not None
-        assert len(profile_output) > 0
-        assert "step" in profile_output or "expression" in profile_output
+        # Check the profile on the stats table itself, no text rendering needed
+        stats = pstats.Stats(profiler)
+        assert stats.total_calls > 0
+        assert any(func_name == "step" for _, _, func_name in stats.stats)
 
-        # Print profile for inspection (will appear in pytest output)
+        # Print the top 10 functions for inspection (shown with pytest -s)
         print("\n" + "=" * 80)
         print("PROFILING OUTPUT: GeneNetwork.step() - 5k × 50 × 1")
         print("=" * 80)
-        print(profile_output)
+        stats.sort_stats('cumulative').print_stats(10)
         print("=" * 80)
 
+    def test_gene_network_run_matches_repeated_step(self):
+        """run(n) produces the same state as n calls to step() with the same seed."""
+        def build():
+            genes = [Gene("A", 1.0), Gene("B", 0.5), Gene("C", 0.3)]
+            reg_net = RegulatoryNetwork(
+                gene_names=["A", "B", "C"],
+                interactions=[
+                    RegulationConnection(source="A", target="B", weight=0.5),
+                    RegulationConnection(source="B", target="C", weight=0.5),
+                ],
+            )
+            composite_expr = CompositeExpressionModel(
+                ConstantExpression(level=0.5), AdditiveRegulation(weight=0.1)
+            )
+            return GeneNetwork(
+                individuals=[Individual(genes=genes)],
+                expression_model=composite_expr,
+                selection_model=ProportionalSelection(),
+                mutation_model=PointMutation(rate=0.2, magnitude=0.05),
+                regulatory_network=reg_net,
+                seed=7,
+            )
+
+        stepped = build()
+        for _ in range(20):
+            stepped.step()
+        ran = build()
+        ran.run(20)
+
+        assert ran.generation == stepped.generation == 20
+        for g_ran, g_step in zip(ran.individuals[0].genes, stepped.individuals[0].genes):
+            assert g_ran.expression_level == g_step.expression_level
+        assert ran.individuals[0].fitness == stepped.individuals[0].fitness
+
+    def test_gene_network_run_respects_running_flag(self, make_model):
+        """run() advances an empty population and does nothing once stopped."""
+        model = make_model(individuals=[])
+        model.run(5)
+        assert model.generation == 5
+
+        model._running = False
+        model.run(5)
+        assert model.generation == 5
+
+    @pytest.mark.parametrize("n_individuals", [0, 2])
+    def test_gene_network_step_ignores_running_flag(self, make_model, n_individuals):
+        """step() always advances one generation, even on a stopped model."""
+        model = make_model(
+            individuals=[Individual(genes=[Gene("A", 1.0)]) for _ in range(n_individuals)]
+        )
+        model._running = False
+        model.step()
+        assert model.generation == 1
+
+    def test_gene_network_rebinds_changed_gene_list(self, make_model):
+        """A reassigned or resized gene list is picked up by step()."""
+        model = make_model(individuals=[Individual([Gene("A", 1.0), Gene("B", 1.0)])])
+        individual = model.individuals[0]
+        replacement = Gene("A", 5.0)
+        individual.genes = [replacement, individual.genes[1]]
+
+        model.step()
+
+        assert np.shares_memory(replacement._row, model.expression_matrix)
+        assert replacement.expression_level == individual.genes[1].expression_level
+        assert model.expression_matrix[0, 0] == replacement.expression_level
+
+        added = Gene("C", 5.0)
+        individual.genes.append(added)
+        model.step()
+
+        assert model.expression_matrix.shape == (1, 3)
+        assert added.expression_level == replacement.expression_level
+
+    def test_gene_network_rejects_mismatched_gene_counts(self, make_model):
+        """Individuals with different gene counts are rejected, naming the offender."""
+        individuals = [
+            Individual([Gene("A", 1.0)]),
+            Individual([Gene("A", 1.0), Gene("B", 2.0)]),
+        ]
+        with pytest.raises(ValueError, match="individual 1 has 2 genes"):
+            make_model(individuals=individuals)
+
+    def test_gene_network_copies_individual_bound_elsewhere(self, make_model):
+        """An individual already bound to one network is copied into a second one."""
+        individual = Individual([Gene("A", 1.0)])
+        first = make_model(individuals=[individual])
+        second = make_model(individuals=[individual])
+
+        assert second.individuals[0] is not individual
+        assert first.individuals[0] is individual
+        first.expression_matrix[0, 0] = 3.0
+        second.expression_matrix[0, 0] = 7.0
+        assert individual.genes[0].expression_level == 3.0
+        assert second.individuals[0].genes[0].expression_level == 7.0
+
+    def test_gene_network_copies_repeated_individual(self, make_model):
+        """An individual listed twice gets a row per entry; the repeat becomes a copy."""
+        individual = Individual([Gene("A", 1.0), Gene("B", 2.0)])
+        model = make_model(individuals=[individual, individual])
+
+        first, second = model.individuals
+        assert first is individual and second is not individual
+        assert [g.name for g in second.genes] == ["A", "B"]
+        model.expression_matrix[1, 0] = 9.0
+        assert first.genes[0].expression_level == 1.0
+        assert second.genes[0].expression_level == 9.0
+
+    def test_gene_network_builds_rng_only_when_mutation_draws(self, models):
+        """A network whose mutation draws nothing never seeds its generator."""
+        expr_model, select_model, _ = models
+        networks = [
+            GeneNetwork(
+                individuals=[Individual([Gene("A", 1.0)])],
+                expression_model=expr_model,
+                selection_model=select_model,
+                mutation_model=PointMutation(rate=rate, magnitude=0.1),
+                seed=42,
+            )
+            for rate in (0.0, 0.5)
+        ]
+        for network in networks:
+            network.run(3)
+            network.step()
+
+        idle, mutating = networks
+        assert idle._rng is None
+        assert mutating._rng is not None
+
+    def test_gene_network_run_uses_overridden_step(self, make_model):
+        """run() goes through step() when it has been replaced on the instance."""
+        model = make_model(individuals=[Individual(genes=[Gene("A", 1.0)])])
+        calls = []
+        original_step = model.step
+        model.step = lambda: calls.append(original_step())
+        model.run(3)
+        assert len(calls) == 3
+        assert model.generation == 3
+
+    def test_gene_network_regulation_ignored_by_non_composite_model(self, models):
+        """A base model with a regulatory network fills expression from conditions only."""
+        reg_net = RegulatoryNetwork(
+            gene_names=["A", "B"],
+            interactions=[RegulationConnection(source="A", target="B", weight=5.0)],
+        )
+        individuals = [
+            Individual.from_row(["A", "B"], [3.0, 1.0]) for _ in range(4)
+        ]
+        _, select_model, mutate_model = models
+        network = GeneNetwork(
+            individuals=individuals,
+            expression_model=LinearExpression(slope=2.0, intercept=0.5),
+            selection_model=select_model,
+            mutation_model=mutate_model,
+            conditions=Conditions(tf_concentration=1.5),
+            regulatory_network=reg_net,
+            seed=1,
+        )
+
+        network.step()
+
+        for individual in network.individuals:
+            assert [g.expression_level for g in individual.genes] == [3.5, 3.5]
+            assert individual.fitness == pytest.approx(3.5)
+
+    def test_gene_network_genes_read_population_matrix(self, make_model):
+        """Genes of a network's individuals are backed by one shared expression matrix."""
+        individuals = [
+            Individual(genes=[Gene("A", 1.0), Gene("B", 2.0)]),
+            Individual(genes=[Gene("A", 3.0), Gene("B", 4.0)]),
+        ]
+        network = make_model(
+            individuals=individuals,
+            expression_model=LinearExpression(slope=0.0, intercept=1.0),
+            seed=1,
+        )
+
+        np.testing.assert_array_equal(network.expression_matrix, [[1.0, 2.0], [3.0, 4.0]])
+        network.expression_matrix[1, 0] = 7.5
+        assert individuals[1].genes[0].expression_level == 7.5
+        assert isinstance(individuals[1].genes[0].expression_level, float)
+
+    def test_gene_network_rebinds_when_population_changes(self, make_model):
+        """Individuals added between steps are folded into the expression matrix."""
+        network = make_model(
+            individuals=[Individual(genes=[Gene("A", 1.0)])],
+            expression_model=ConstantExpression(level=2.0),
+            seed=1,
+        )
+        network.step()
+
+        newcomer = Individual(genes=[Gene("A", 0.25)])
+        network.individuals.append(newcomer)
+        assert newcomer.genes[0].expression_level == 0.25
+        np.testing.assert_array_equal(network.expression_matrix, [[2.0], [0.25]])
+
+        network.step()
+
+        assert network.expression_matrix.shape == (2, 1)
+        assert [ind.genes[0].expression_level for ind in network.individuals] == [2.0, 2.0]
+        assert newcomer.fitness == pytest.approx(2.0)
+
+    def test_gene_network_expression_phase_follows_model_swap(self, make_model):
+        """Replacing expression_model between steps switches the specialized path."""
+        reg_net = RegulatoryNetwork(
+            gene_names=["A", "B"],
+            interactions=[RegulationConnection(source="A", target="B", weight=1.0)],
+        )
+        network = make_model(
+            individuals=[Individual(genes=[Gene("A", 1.0), Gene("B", 0.0)])],
+            expression_model=ConstantExpression(level=1.0),
+            regulatory_network=reg_net,
+            seed=1,
+        )
+        network.step()
+        assert [g.expression_level for g in network.individuals[0].genes] == [1.0, 1.0]
+
+        network.expression_model = CompositeExpressionModel(
+            ConstantExpression(level=1.0), AdditiveRegulation(weight=0.5)
+        )
+        network.step()
+        # B = 1.0 + 0.5 * (1.0 * A) with A = 1.0 from the previous generation
+        assert [g.expression_level for g in network.individuals[0].genes] == [1.0, 1.5]
+
+    def test_gene_network_from_arrays_matches_object_construction(self):
+        """from_arrays() evolves identically to a network built from Gene objects."""
+        expr_init = np.array([[1.0, -0.5, 2.0], [0.25, 0.5, 0.75]])
+        names = ["A", "B", "C"]
+        models = dict(
+            expression_model=LinearExpression(slope=0.5, intercept=0.1),
+            selection_model=ProportionalSelection(),
+            mutation_model=PointMutation(rate=0.3, magnitude=0.1),
+        )
+        from_arrays = GeneNetwork.from_arrays(expr_init, names, seed=5, **models)
+        from_objects = GeneNetwork(
+            individuals=[Individual.from_row(names, row) for row in expr_init],
+            seed=5,
+            **models,
+        )
+
+        assert from_arrays.individuals[0].genes[1].expression_level == 0.0
+        assert [g.name for g in from_arrays.individuals[1].genes] == names
+        for _ in range(5):
+            from_arrays.step()
+            from_objects.step()
+        np.testing.assert_array_equal(
+            from_arrays.expression_matrix, from_objects.expression_matrix
+        )
+        assert [i.fitness for i in from_arrays.individuals] == [
+            i.fitness for i in from_objects.individuals
+        ]
+
+        with pytest.raises(ValueError):
+            GeneNetwork.from_arrays(expr_init, ["A", "B"], **models)
+
+    def test_gene_network_float32_matches_float64(self, models):
+        """A float32 network stores a float32 matrix and tracks float64 results."""
+        expr_model, select_model, _ = models
+        mutate_model = PointMutation(rate=0.2, magnitude=0.05)
+        expr_init = np.random.default_rng(3).uniform(0.5, 2.0, size=(30, 6))
+        names = [f"G{j}" for j in range(6)]
+        networks = [
+            GeneNetwork.from_arrays(
+                expr_init, names, expr_model, select_model, mutate_model, seed=5, dtype=dtype
+            )
+            for dtype in (np.float64, np.float32)
+        ]
+        for network in networks:
+            network.run(10)
+
+        double, single = networks
+        assert single._expr.dtype == np.float32
+        assert single._expr.nbytes == double._expr.nbytes // 2
+        assert single.individuals[0].expression.dtype == np.float32
+        for ind64, ind32 in zip(double.individuals, single.individuals):
+            assert ind32.mean_expression() == pytest.approx(ind64.mean_expression(), rel=1e-5)
+
+    def test_gene_network_float32_regulated_run(self):
+        """A regulated float32 network stays float32 end to end and tracks float64."""
+        names = ["A", "B", "C"]
+        reg_net = RegulatoryNetwork(
+            gene_names=names,
+            interactions=[
+                RegulationConnection(source="A", target="B", weight=0.5),
+                RegulationConnection(source="B", target="C", weight=-0.5),
+            ],
+        )
+        expr_init = np.random.default_rng(3).uniform(0.5, 2.0, size=(20, 3))
+        networks = [
+            GeneNetwork.from_arrays(
+                expr_init,
+                names,
+                CompositeExpressionModel(
+                    ConstantExpression(level=0.5), AdditiveRegulation(weight=0.1)
+                ),
+                ProportionalSelection(),
+                PointMutation(rate=0.1, magnitude=0.05),
+                seed=5,
+                regulatory_network=reg_net,
+                dtype=dtype,
+            )
+            for dtype in (np.float64, np.float32)
+        ]
+        for network in networks:
+            network.run(100)
+
+        double, single = networks
+        assert single._tf_matrix.dtype == single.expression_matrix.dtype == np.float32
+        assert np.all(single.expression_matrix >= 0.0)
+        assert np.all(np.isfinite(single.expression_matrix))
+        np.testing.assert_allclose(
+            single.expression_matrix, double.expression_matrix, rtol=1e-5, atol=1e-6
+        )
+
+    def test_gene_network_rejects_non_float_dtype(self, models):
+        """GeneNetwork requires a floating-point expression dtype."""
+        with pytest.raises(ValueError):
+            GeneNetwork([], *models, dtype=np.int64)
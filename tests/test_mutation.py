@@ -6,6 +6,12 @@ from happygene.entities import Gene, Individual
 from happygene.mutation import MutationModel, PointMutation
 
 
+@pytest.fixture
+def rng():
+    """Freshly seeded generator for tests that only need some random stream."""
+    return np.random.default_rng(42)
+
+
 class TestMutationModel:
     """Tests for MutationModel ABC."""
 
@@ -69,7 +75,7 @@ class TestPointMutation:
         repr_str = repr(mutator)
         assert "PointMutation" in repr_str
 
-    def test_vectorized_mutation_respects_rate_and_magnitude(self):
+    def test_vectorized_mutation_respects_rate_and_magnitude(self, rng):
         """Vectorized mutation respects rate and magnitude parameters.
 
         Tests that mutate() applies mutations according to the specified
@@ -77,25 +83,22 @@ class TestPointMutation:
         RNG batch calls for improved performance.
         """
         n_genes = 100
-        seed = 42
         rate = 0.5
         magnitude = 0.2
 
         # Create individual
         genes = [Gene(f"g{i}", 1.0) for i in range(n_genes)]
         individual = Individual(genes)
-        rng = np.random.default_rng(seed)
 
         # Apply vectorized mutation
         mutator = PointMutation(rate=rate, magnitude=magnitude)
         mutator.mutate(individual, rng)
 
         # Verify mutations occurred
-        final_levels = [g.expression_level for g in individual.genes]
+        final_levels = individual.expression
 
         # Check that not all genes remained unchanged (rate=0.5 should mutate ~50%)
-        unchanged_count = sum(1 for level in final_levels if np.isclose(level, 1.0))
-        changed_count = n_genes - unchanged_count
+        changed_count = int(np.count_nonzero(~np.isclose(final_levels, 1.0)))
 
         # With rate=0.5, expect approximately 50% mutations (allow ±20% margin)
         expected_mutations = n_genes * rate
@@ -103,54 +106,151 @@ class TestPointMutation:
             f"Expected ~50 mutations, got {changed_count}"
 
         # Verify all expression levels are non-negative
-        for level in final_levels:
-            assert level >= 0.0, f"Negative expression level: {level}"
+        assert np.all(final_levels >= 0.0), f"Negative expression level: {final_levels.min()}"
 
-    def test_vectorized_mutation_with_zero_rate(self):
+    def test_vectorized_mutation_with_zero_rate(self, rng):
         """Vectorized mutation with rate=0 leaves genes unchanged."""
         n_genes = 50
-        seed = 42
 
         genes = [Gene(f"g{i}", 1.0) for i in range(n_genes)]
         individual = Individual(genes)
-        rng = np.random.default_rng(seed)
 
         mutator = PointMutation(rate=0.0, magnitude=0.5)
         mutator.mutate(individual, rng)
 
         # No genes should mutate with rate=0
-        for gene in individual.genes:
-            assert np.isclose(gene.expression_level, 1.0)
+        np.testing.assert_array_equal(individual.expression, np.ones(n_genes))
 
-    def test_vectorized_mutation_with_rate_one(self):
+    def test_vectorized_mutation_with_rate_one(self, rng):
         """Vectorized mutation with rate=1 mutates all genes."""
         n_genes = 50
-        seed = 42
 
         genes = [Gene(f"g{i}", 1.0) for i in range(n_genes)]
         individual = Individual(genes)
-        rng = np.random.default_rng(seed)
 
         mutator = PointMutation(rate=1.0, magnitude=0.5)
         mutator.mutate(individual, rng)
 
         # All genes should be mutated (differ from 1.0)
-        mutated_count = sum(1 for g in individual.genes if not np.isclose(g.expression_level, 1.0))
+        mutated_count = int(np.count_nonzero(~np.isclose(individual.expression, 1.0)))
         assert mutated_count == n_genes, \
             f"Expected all {n_genes} genes mutated, got {mutated_count}"
 
-    def test_vectorized_mutation_clamps_negative(self):
+    @pytest.mark.parametrize("row_backed", [False, True], ids=["standalone", "row"])
+    @pytest.mark.parametrize("rate", [0.3, 0.8], ids=["sparse", "dense"])
+    def test_vectorized_mutation_matches_per_gene_rule(self, row_backed, rate):
+        """mutate() perturbs exactly the sampled loci, matching mutate_batch() draws."""
+        names = [f"g{i}" for i in range(40)]
+        start = np.linspace(0.0, 2.0, 40)
+        if row_backed:
+            individual = Individual.from_row(names, start.copy())
+        else:
+            individual = Individual([Gene(name, level) for name, level in zip(names, start)])
+
+        PointMutation(rate=rate, magnitude=0.5).mutate(individual, np.random.default_rng(11))
+
+        expected = PointMutation(rate=rate, magnitude=0.5).mutate_batch(
+            [], start.copy().reshape(1, -1), np.random.default_rng(11)
+        )
+        np.testing.assert_array_equal(individual.expression, expected[0])
+        assert np.count_nonzero(individual.expression != start) > 0
+
+    def test_mutate_low_rate_samples_mutated_loci(self):
+        """At low rates mutate() draws the mutation count, then distinct loci."""
+        individual = Individual([Gene(f"g{i}", 1.0) for i in range(50)])
+        PointMutation(rate=0.1, magnitude=0.3).mutate(individual, np.random.default_rng(5))
+
+        rng = np.random.default_rng(5)
+        n_mutated = rng.binomial(50, 0.1)
+        loci = rng.choice(50, size=n_mutated, replace=False)
+        expected = np.ones(50)
+        expected[loci] = np.maximum(1.0 + rng.standard_normal(n_mutated) * 0.3, 0.0)
+        np.testing.assert_array_equal(individual.expression, expected)
+
+    def test_vectorized_mutation_clamps_negative(self, rng):
         """Vectorized mutation clamps expression to [0, inf)."""
         genes = [Gene("g0", 0.1)]
         individual = Individual(genes)
-        rng = np.random.default_rng(42)
 
         # Large negative perturbations with rate=1 should be clamped to 0
         mutator = PointMutation(rate=1.0, magnitude=10.0)
 
-        # Run multiple times to increase chance of large negative perturbations
-        for _ in range(10):
-            rng = np.random.default_rng(np.random.randint(0, 1000000))
-            mutator.mutate(individual, rng)
+        # Independent child streams increase the chance of large negative perturbations
+        for child in rng.spawn(10):
+            mutator.mutate(individual, child)
             assert individual.genes[0].expression_level >= 0.0, \
                 f"Expression level not clamped: {individual.genes[0].expression_level}"
+
+    def test_mutate_batch_respects_rate_and_clamps(self, rng):
+        """mutate_batch() mutates ~rate of entries and keeps all entries >= 0."""
+        mutator = PointMutation(rate=0.3, magnitude=2.0)
+        expr_matrix = np.full((200, 50), 1.0)
+
+        result = mutator.mutate_batch([], expr_matrix, rng)
+
+        assert result is expr_matrix
+        changed_fraction = np.mean(expr_matrix != 1.0)
+        assert 0.25 <= changed_fraction <= 0.35
+        assert np.all(expr_matrix >= 0.0)
+        assert np.any(expr_matrix == 0.0)
+
+    def test_mutate_batch_zero_rate_leaves_matrix_unchanged(self):
+        """mutate_batch() with rate=0 leaves every entry unchanged."""
+        mutator = PointMutation(rate=0.0, magnitude=5.0)
+        expr_matrix = np.arange(12, dtype=float).reshape(3, 4)
+
+        mutator.mutate_batch([], expr_matrix, np.random.default_rng(0))
+
+        np.testing.assert_array_equal(expr_matrix, np.arange(12).reshape(3, 4))
+
+    def test_mutate_batch_default_delegates_to_mutate(self):
+        """Models without a batch override mutate each individual via mutate()."""
+
+        class DoublingMutation(MutationModel):
+            def mutate(self, individual, rng):
+                for gene in individual.genes:
+                    gene._assign(gene.expression_level * 2.0)
+
+        individuals = [Individual([Gene("a", 0.0), Gene("b", 0.0)]) for _ in range(2)]
+        expr_matrix = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        DoublingMutation().mutate_batch(individuals, expr_matrix, np.random.default_rng(0))
+
+        np.testing.assert_array_equal(expr_matrix, [[2.0, 4.0], [6.0, 8.0]])
+        assert [g.expression_level for g in individuals[1].genes] == [6.0, 8.0]
+
+    def test_mutate_batch_zero_rate_draws_no_random_numbers(self):
+        """mutate_batch() with rate=0 or magnitude=0 leaves the RNG untouched."""
+        for mutator in (PointMutation(rate=0.0, magnitude=1.0), PointMutation(rate=0.5, magnitude=0.0)):
+            rng = np.random.default_rng(3)
+            mutator.mutate_batch([], np.ones((10, 10)), rng)
+            assert rng.random() == np.random.default_rng(3).random()
+
+    def test_mutate_batch_reuses_buffers_across_shapes(self):
+        """Repeated dense-path calls (including shape changes) match fresh seeded draws."""
+        mutator = PointMutation(rate=0.7, magnitude=0.3)
+        for shape in [(20, 5), (20, 5), (8, 3), (20, 5)]:
+            expr = mutator.mutate_batch([], np.ones(shape), np.random.default_rng(9))
+
+            rng = np.random.default_rng(9)
+            expected = np.ones(shape)
+            mask = rng.random(shape) < 0.7
+            expected[mask] = np.maximum(
+                expected[mask] + rng.standard_normal(np.count_nonzero(mask)) * 0.3, 0.0
+            )
+            np.testing.assert_array_equal(expr, expected)
+
+    def test_mutate_batch_low_rate_samples_mutated_loci(self):
+        """At low rates the mutation count and distinct loci are drawn directly."""
+        mutator = PointMutation(rate=0.4, magnitude=0.3)
+        expr = mutator.mutate_batch([], np.ones((20, 5)), np.random.default_rng(9))
+
+        rng = np.random.default_rng(9)
+        expected = np.ones(100)
+        n_mutated = rng.binomial(100, 0.4)
+        loci = rng.choice(100, size=n_mutated, replace=False)
+        expected[loci] = np.maximum(
+            expected[loci] + rng.standard_normal(n_mutated) * 0.3, 0.0
+        )
+        np.testing.assert_array_equal(expr, expected.reshape(20, 5))
+        assert np.count_nonzero(expr != 1.0) == n_mutated
@@ -1,4 +1,5 @@
 """Tests for RegulatoryExpressionModel and CompositeExpressionModel (ADR-005)."""
+import numpy as np
 import pytest
 from happygene.conditions import Conditions
 from happygene.expression import LinearExpression, HillExpression, ConstantExpression
@@ -226,3 +227,43 @@ class TestCompositeExpressionModel:
         # result = 11.0 * (1 + 2.0*4.0) = 11.0 * 9.0 = 99.0
         result = composite.compute(conditions, tf_inputs=4.0)
         assert result == pytest.approx(99.0)
+
+    @pytest.mark.parametrize(
+        "reg_model",
+        [AdditiveRegulation(weight=-0.7), MultiplicativeRegulation(weight=0.4)],
+    )
+    def test_composite_expression_compute_batch_matches_compute(self, reg_model):
+        """compute_batch() equals compute() for every (individual, gene) entry."""
+        inner = CompositeExpressionModel(
+            LinearExpression(slope=1.5, intercept=0.5), AdditiveRegulation(weight=2.0)
+        )
+        composite = CompositeExpressionModel(inner, reg_model)
+        conditions = Conditions(tf_concentration=0.8)
+        tf_inputs = np.random.default_rng(3).uniform(-3.0, 3.0, size=(5, 4))
+
+        out = np.empty((5, 4))
+        result = composite.compute_batch(conditions, out, tf_inputs=tf_inputs)
+
+        assert result is out
+        expected = [
+            [composite.compute(conditions, tf_inputs=tf) for tf in row]
+            for row in tf_inputs
+        ]
+        np.testing.assert_array_equal(out, expected)
+        assert np.all(out >= 0.0)
+
+    def test_composite_expression_compute_batch_custom_regulation_fallback(self):
+        """Regulatory layers without a batch override fall back to compute()."""
+
+        class CappedRegulation(RegulatoryExpressionModel):
+            def compute(self, base_expression, tf_inputs):
+                return min(base_expression + self.weight * tf_inputs, 1.0)
+
+        composite = CompositeExpressionModel(
+            ConstantExpression(level=0.5), CappedRegulation(weight=1.0)
+        )
+        out = np.empty((2, 2))
+        composite.compute_batch(
+            Conditions(), out, tf_inputs=np.array([[0.0, 0.25], [1.0, 2.0]])
+        )
+        np.testing.assert_array_equal(out, [[0.5, 0.75], [1.0, 1.0]])
@@ -96,24 +96,56 @@ def test_regulatory_network_is_acyclic_detects_cycle():
     assert net.is_acyclic is False
 
 
+def test_regulatory_network_is_acyclic_computed_once_on_access(monkeypatch):
+    """Cycle detection is deferred until is_acyclic is read, then cached."""
+    interactions = [RegulationConnection(source="g1", target="g2", weight=0.5)]
+    net = RegulatoryNetwork(gene_names=["g1", "g2"], interactions=interactions)
+    assert net._is_acyclic is None
+
+    calls = []
+    compute = net._compute_is_acyclic
+    monkeypatch.setattr(net, "_compute_is_acyclic", lambda: calls.append(1) or compute())
+    assert net.is_acyclic is True
+    assert net.is_acyclic is True
+    assert len(calls) == 1
+
+
+def test_regulatory_network_zero_weight_edge_ignored_by_circuit_detection():
+    """Edges whose weights cancel or are zero do not form circuits or motifs."""
+    interactions = [
+        RegulationConnection(source="g1", target="g2", weight=1.0),
+        RegulationConnection(source="g2", target="g3", weight=0.5),
+        RegulationConnection(source="g1", target="g3", weight=0.4),
+        RegulationConnection(source="g1", target="g3", weight=-0.4),  # cancels
+        RegulationConnection(source="g3", target="g1", weight=0.0),
+    ]
+    net = RegulatoryNetwork(
+        gene_names=["g1", "g2", "g3"], interactions=interactions, detect_circuits=True
+    )
+
+    assert net.is_acyclic is True
+    assert net.circuits == []
+    assert net.feedforward_motifs == []
+
+
 def test_regulatory_network_large_sparse_network():
     """Performance: large sparse network (100 genes, 1% density = ~100 edges)."""
     n_genes = 100
     gene_names = [f"g{i}" for i in range(n_genes)]
 
     # Create ~1% density network
-    interactions = []
-    np.random.seed(42)
-    for src_idx in range(n_genes):
-        for tgt_idx in range(n_genes):
-            if src_idx != tgt_idx and np.random.random() < 0.01:  # ~1% edges
-                interactions.append(
-                    RegulationConnection(
-                        source=gene_names[src_idx],
-                        target=gene_names[tgt_idx],
-                        weight=np.random.uniform(-1.0, 1.0)
-                    )
-                )
+    rng = np.random.default_rng(42)
+    has_edge = rng.random((n_genes, n_genes)) < 0.01  # ~1% edges
+    np.fill_diagonal(has_edge, False)
+    weights = rng.uniform(-1.0, 1.0, size=(n_genes, n_genes))
+    interactions = [
+        RegulationConnection(
+            source=gene_names[src_idx],
+            target=gene_names[tgt_idx],
+            weight=weights[src_idx, tgt_idx],
+        )
+        for src_idx, tgt_idx in zip(*np.nonzero(has_edge))
+    ]
 
     net = RegulatoryNetwork(gene_names=gene_names, interactions=interactions)
     assert net.adjacency.shape == (n_genes, n_genes)
@@ -153,6 +185,48 @@ def test_regulatory_network_compute_tf_inputs_shape_mismatch():
         net.compute_tf_inputs(wrong_expr)
 
 
+def test_regulatory_network_compute_tf_inputs_batch_matches_rows():
+    """compute_tf_inputs_batch equals compute_tf_inputs applied to each row."""
+    interactions = [
+        RegulationConnection(source="g1", target="g2", weight=0.5),
+        RegulationConnection(source="g2", target="g3", weight=-1.2),
+        RegulationConnection(source="g3", target="g1", weight=0.8),
+    ]
+    net = RegulatoryNetwork(gene_names=["g1", "g2", "g3"], interactions=interactions)
+    expr_matrix = np.random.default_rng(0).uniform(0.0, 2.0, size=(6, 3))
+
+    tf_matrix = net.compute_tf_inputs_batch(expr_matrix)
+
+    assert tf_matrix.shape == (6, 3)
+    for row, tf_row in zip(expr_matrix, tf_matrix):
+        np.testing.assert_allclose(tf_row, net.compute_tf_inputs(row), rtol=1e-12)
+
+    out = np.empty((6, 3))
+    assert net.compute_tf_inputs_batch(expr_matrix, out=out) is out
+    np.testing.assert_allclose(out, tf_matrix, rtol=1e-12)
+
+    with pytest.raises(ValueError, match="expr_matrix shape"):
+        net.compute_tf_inputs_batch(expr_matrix[:, :2])
+
+
+def test_regulatory_network_compute_tf_inputs_batch_float32():
+    """float32 populations get float32 TF inputs from a cached float32 weight copy."""
+    interactions = [
+        RegulationConnection(source="g1", target="g2", weight=0.5),
+        RegulationConnection(source="g2", target="g3", weight=-1.2),
+    ]
+    net = RegulatoryNetwork(gene_names=["g1", "g2", "g3"], interactions=interactions)
+    expr64 = np.random.default_rng(0).uniform(0.0, 2.0, size=(6, 3))
+    expr32 = expr64.astype(np.float32)
+
+    tf32 = net.compute_tf_inputs_batch(expr32)
+
+    assert tf32.dtype == np.float32
+    np.testing.assert_allclose(tf32, net.compute_tf_inputs_batch(expr64), rtol=1e-6)
+    assert net._dense_weights_like(expr32) is net._dense_weights_like(expr32)
+    assert net._dense_weights_like(expr64) is net._dense_weights_t
+
+
 def test_regulatory_network_multiple_edges_same_pair():
     """Multiple edges between same gene pair (last one wins in sparse matrix)."""
     interactions = [
@@ -333,18 +407,18 @@ def test_regulatory_network_circuit_detection_performance():
     gene_names = [f"g{i}" for i in range(n_genes)]
 
     # Create ~1% density network
-    interactions = []
-    np.random.seed(42)
-    for src_idx in range(n_genes):
-        for tgt_idx in range(n_genes):
-            if src_idx != tgt_idx and np.random.random() < 0.01:  # ~1% edges
-                interactions.append(
-                    RegulationConnection(
-                        source=gene_names[src_idx],
-                        target=gene_names[tgt_idx],
-                        weight=np.random.uniform(-1.0, 1.0)
-                    )
-                )
+    rng = np.random.default_rng(42)
+    has_edge = rng.random((n_genes, n_genes)) < 0.01  # ~1% edges
+    np.fill_diagonal(has_edge, False)
+    weights = rng.uniform(-1.0, 1.0, size=(n_genes, n_genes))
+    interactions = [
+        RegulationConnection(
+            source=gene_names[src_idx],
+            target=gene_names[tgt_idx],
+            weight=weights[src_idx, tgt_idx],
+        )
+        for src_idx, tgt_idx in zip(*np.nonzero(has_edge))
+    ]
 
     # Measure circuit detection time
     start = time.time()
@@ -401,3 +475,68 @@ def test_regulatory_network_multiple_feedforward_motifs():
     motifs = list(net.feedforward_motifs)
     assert ("g1", "g2", "g3") in motifs
     assert ("g2", "g3", "g4") in motifs
+
+
+def test_regulatory_network_compute_tf_inputs_batch_large_network_uses_sparse():
+    """Networks above the dense cutoff still produce correct batch TF inputs."""
+    from happygene.regulatory_network import _DENSE_TF_MAX_GENES
+
+    n_genes = _DENSE_TF_MAX_GENES + 1
+    names = [f"g{i}" for i in range(n_genes)]
+    interactions = [
+        RegulationConnection(source=names[i], target=names[i + 1], weight=0.5)
+        for i in range(n_genes - 1)
+    ]
+    net = RegulatoryNetwork(gene_names=names, interactions=interactions)
+    expr_matrix = np.random.default_rng(1).uniform(0.0, 1.0, size=(3, n_genes))
+
+    out = np.empty_like(expr_matrix)
+    tf_matrix = net.compute_tf_inputs_batch(expr_matrix, out=out)
+
+    assert tf_matrix is out
+    for row, tf_row in zip(expr_matrix, tf_matrix):
+        np.testing.assert_array_equal(tf_row, net.compute_tf_inputs(row))
+
+
+def test_regulatory_network_dense_weights_follow_density():
+    """Mid-size networks keep dense weights only when enough edges are present."""
+    n_genes = 200
+    names = [f"g{i}" for i in range(n_genes)]
+    chain = [
+        RegulationConnection(source=names[i], target=names[i + 1], weight=0.5)
+        for i in range(n_genes - 1)
+    ]
+    sparse_net = RegulatoryNetwork(gene_names=names, interactions=chain)
+    dense_net = RegulatoryNetwork(
+        gene_names=names,
+        interactions=[
+            RegulationConnection(source=names[i], target=names[(i + k) % n_genes], weight=0.5)
+            for i in range(n_genes)
+            for k in range(1, 12)
+        ],
+    )
+    assert sparse_net._dense_weights_t is None
+    assert dense_net._dense_weights_t is not None
+
+    expr_matrix = np.random.default_rng(2).uniform(0.0, 1.0, size=(4, n_genes))
+    for net in (sparse_net, dense_net):
+        tf_matrix = net.compute_tf_inputs_batch(expr_matrix)
+        np.testing.assert_allclose(
+            tf_matrix, (net.adjacency @ expr_matrix.T).T, rtol=1e-12
+        )
+
+
+def test_regulatory_network_dense_weights_precomputed_read_only():
+    """Dense weights are built once at init, read-only, and match the adjacency."""
+    interactions = [
+        RegulationConnection(source="g1", target="g2", weight=0.5),
+        RegulationConnection(source="g2", target="g3", weight=-0.25),
+    ]
+    net = RegulatoryNetwork(gene_names=["g1", "g2", "g3"], interactions=interactions)
+
+    np.testing.assert_array_equal(net._dense_weights_t, net.adjacency.toarray().T)
+    with pytest.raises(ValueError):
+        net._dense_weights_t[0, 1] = 1.0
+    np.testing.assert_allclose(
+        net.compute_tf_inputs(np.array([2.0, 4.0, 1.0])), [0.0, 1.0, -1.0]
+    )
@@ -131,6 +131,63 @@ class TestProportionalSelection:
         assert fitness_batch.shape == (2,)
         np.testing.assert_array_equal(fitness_batch, [0.0, 0.0])
 
+    def test_proportional_selection_compute_fitness_batch_integer_matrix(self):
+        """Integer expression matrices average in float64, like np.mean."""
+        selector = ProportionalSelection()
+        fitness_batch = selector.compute_fitness_batch(np.array([[1, 2], [3, 6]]))
+
+        assert fitness_batch.dtype == np.float64
+        np.testing.assert_array_equal(fitness_batch, [1.5, 4.5])
+
+    def test_proportional_selection_select_indices_follows_fitness(self):
+        """select_indices never picks zero-fitness individuals and favors fitter ones."""
+        selector = ProportionalSelection()
+        rng = np.random.default_rng(0)
+        fitness = np.array([0.0, 1.0, 3.0])
+        indices = np.concatenate([selector.select_indices(fitness, rng) for _ in range(500)])
+
+        assert indices.shape == (1500,)
+        assert not np.any(indices == 0)
+        assert np.mean(indices == 2) == pytest.approx(0.75, abs=0.05)
+
+    @pytest.mark.parametrize("n", [10, 5000])
+    def test_proportional_selection_select_indices_matches_rng_choice(self, n):
+        """select_indices draws exactly what rng.choice(p=fitness/total) would."""
+        fitness = np.random.default_rng(3).uniform(0.0, 2.0, size=n)
+        fitness[::7] = 0.0
+        indices = ProportionalSelection().select_indices(fitness, np.random.default_rng(4))
+        expected = np.random.default_rng(4).choice(
+            n, size=n, replace=True, p=fitness / fitness.sum()
+        )
+        np.testing.assert_array_equal(indices, expected)
+
+    def test_proportional_selection_select_indices_rejects_infinite_fitness(self):
+        """An infinite total fitness has no proportional distribution."""
+        with pytest.raises(ValueError, match="finite"):
+            ProportionalSelection().select_indices(
+                np.array([1.0, np.inf]), np.random.default_rng(0)
+            )
+
+    def test_proportional_selection_select_zero_total_is_uniform(self):
+        """select_indices falls back to uniform sampling when all fitness is zero."""
+        selector = ProportionalSelection()
+        indices = selector.select_indices(np.zeros(4), np.random.default_rng(1))
+        assert indices.shape == (4,)
+        assert np.all((indices >= 0) & (indices < 4))
+
+    def test_proportional_selection_select_returns_individuals(self):
+        """select returns population members and validates its inputs."""
+        selector = ProportionalSelection()
+        individuals = [Individual([Gene("g", 1.0)]), Individual([Gene("g", 2.0)])]
+        chosen = selector.select(individuals, np.array([0.0, 1.0]), np.random.default_rng(2))
+
+        assert chosen == [individuals[1], individuals[1]]
+        assert selector.select([], np.empty(0), np.random.default_rng(2)) == []
+        with pytest.raises(ValueError):
+            selector.select(individuals, np.array([1.0]), np.random.default_rng(2))
+        with pytest.raises(ValueError):
+            selector.select(individuals, np.array([-1.0, 1.0]), np.random.default_rng(2))
+
 
 class TestThresholdSelection:
     """Tests for ThresholdSelection model."""
@@ -229,6 +286,14 @@ class TestThresholdSelection:
             individual_fitness = selector.compute_fitness(individual)
             assert individual_fitness == fitness_batch[i]
 
+    def test_threshold_selection_compute_fitness_batch_integer_matrix(self):
+        """Integer expression matrices are thresholded on their float64 means."""
+        selector = ThresholdSelection(threshold=2.0)
+        fitness_batch = selector.compute_fitness_batch(np.array([[1, 2], [3, 6]]))
+
+        assert fitness_batch.dtype == np.float64
+        np.testing.assert_array_equal(fitness_batch, [0.0, 1.0])
+
     def test_threshold_selection_compute_fitness_batch_all_below_threshold(self):
         """ThresholdSelection.compute_fitness_batch with all below threshold."""
         selector = ThresholdSelection(threshold=10.0)
@@ -253,6 +318,27 @@ class TestThresholdSelection:
         assert fitness_batch.shape == (2,)
         np.testing.assert_array_equal(fitness_batch, [1.0, 1.0])
 
+    @pytest.mark.parametrize("threshold", [-1.0, 0.0, 0.5])
+    def test_threshold_selection_compute_fitness_batch_zero_genes_matches_scalar(self, threshold):
+        """Batch fitness for gene-less individuals matches compute_fitness()."""
+        selector = ThresholdSelection(threshold=threshold)
+        fitness_batch = selector.compute_fitness_batch(np.empty((3, 0)))
+
+        expected = selector.compute_fitness(Individual([]))
+        np.testing.assert_array_equal(fitness_batch, [expected] * 3)
+
+    def test_threshold_selection_compute_fitness_batch_boundary_is_float(self):
+        """Mean exactly at threshold maps to 1.0 and the result is float64."""
+        selector = ThresholdSelection(threshold=1.5)
+        expr_matrix = np.array([
+            [1.0, 2.0],
+            [1.5, 1.4],
+        ])
+        fitness_batch = selector.compute_fitness_batch(expr_matrix)
+
+        assert fitness_batch.dtype == np.float64
+        np.testing.assert_array_equal(fitness_batch, [1.0, 0.0])
+
 
 class TestSexualReproduction:
     """Tests for SexualReproduction model (crossover + mating)."""
@@ -326,6 +412,39 @@ class TestSexualReproduction:
         assert len(offspring.genes) == 5
         assert all(offspring.genes[i].name == f"g{i}" for i in range(5))
 
+    def test_sexual_reproduction_mate_batch_inherits_per_locus(self):
+        """mate_batch() returns (n, G) offspring whose loci come from one parent."""
+        selector = SexualReproduction(crossover_rate=0.3)
+        parent1_expr = np.arange(1.0, 7.0)
+        parent2_expr = -np.arange(1.0, 7.0)
+
+        offspring = selector.mate_batch(
+            parent1_expr, parent2_expr, 400, np.random.default_rng(42)
+        )
+
+        assert offspring.shape == (400, 6)
+        from_parent2 = offspring < 0
+        np.testing.assert_array_equal(
+            np.abs(offspring), np.broadcast_to(parent1_expr, offspring.shape)
+        )
+        assert 0.25 <= from_parent2.mean() <= 0.35
+
+    def test_sexual_reproduction_mate_matches_mate_batch_row(self):
+        """mate() equals a single-row mate_batch() drawn from the same seed."""
+        selector = SexualReproduction(crossover_rate=0.5)
+        parent1 = Individual([Gene(f"g{i}", float(i + 1)) for i in range(8)])
+        parent2 = Individual([Gene(f"g{i}", float(i + 0.5)) for i in range(8)])
+
+        offspring = selector.mate(parent1, parent2, np.random.default_rng(11))
+        row = selector.mate_batch(
+            np.array([g.expression_level for g in parent1.genes]),
+            np.array([g.expression_level for g in parent2.genes]),
+            1,
+            np.random.default_rng(11),
+        )[0]
+
+        assert [g.expression_level for g in offspring.genes] == row.tolist()
+
     def test_sexual_reproduction_repr(self):
         """SexualReproduction has informative repr."""
         selector = SexualReproduction(crossover_rate=0.7)
@@ -546,6 +665,72 @@ class TestEpistaticFitness:
         assert fitness_batch.shape == (2,)
         np.testing.assert_allclose(fitness_batch, [1.5, 3.5])
 
+    def test_epistatic_fitness_batch_matches_explicit_pairwise_sum(self):
+        """Batch quadratic form equals sum_ij x_i x_j W_ij / n for asymmetric W."""
+        rng = np.random.default_rng(0)
+        interactions = rng.normal(size=(4, 4))
+        selector = EpistaticFitness(interaction_matrix=interactions)
+        expr_matrix = rng.uniform(0.0, 2.0, size=(5, 4))
+
+        fitness_batch = selector.compute_fitness_batch(expr_matrix)
+
+        for i, x in enumerate(expr_matrix):
+            pairwise = sum(
+                x[a] * x[b] * interactions[a, b] for a in range(4) for b in range(4)
+            )
+            assert fitness_batch[i] == pytest.approx(x.mean() + pairwise / 4)
+
+    @pytest.mark.parametrize(
+        "interactions",
+        [
+            np.diag([0.1, -0.4, 0.3]),
+            np.diag([0.1, -0.4, 0.3]) + np.array([[0, 1, 0], [-1, 0, 2], [0, -2, 0]]),
+            np.array([[0.2, 0.5, 0.0], [0.5, -0.1, 0.3], [0.0, 0.3, 0.4]]),
+        ],
+    )
+    def test_epistatic_fitness_symmetric_part_matches_full_quadratic_form(self, interactions):
+        """Diagonal, antisymmetric-offdiagonal and general W all match x^T W x / n."""
+        selector = EpistaticFitness(interaction_matrix=interactions)
+        expr_matrix = np.random.default_rng(2).uniform(0.0, 2.0, size=(6, 3))
+
+        fitness_batch = selector.compute_fitness_batch(expr_matrix)
+
+        expected = expr_matrix.mean(axis=1) + np.array(
+            [x @ interactions @ x for x in expr_matrix]
+        ) / 3
+        np.testing.assert_allclose(fitness_batch, expected, rtol=1e-12)
+        np.testing.assert_array_equal(selector.interaction_matrix, interactions)
+
+    def test_epistatic_fitness_batch_results_independent_across_calls(self):
+        """Reused internal buffers never leak into previously returned results."""
+        selector = EpistaticFitness(interaction_matrix=np.array([[0.2, 0.5], [0.1, -0.3]]))
+        first_input = np.array([[1.0, 2.0], [0.5, 0.5]])
+
+        first = selector.compute_fitness_batch(first_input)
+        snapshot = first.copy()
+        selector.compute_fitness_batch(np.array([[3.0, 1.0], [0.0, 4.0]]))
+        selector.compute_fitness_batch(np.ones((7, 2)))
+
+        np.testing.assert_array_equal(first, snapshot)
+        np.testing.assert_allclose(
+            selector.compute_fitness_batch(first_input), snapshot, rtol=1e-15
+        )
+
+    def test_epistatic_fitness_reassigned_interaction_matrix_is_used(self):
+        """A reassigned interaction_matrix is used; in-place edits are rejected."""
+        selector = EpistaticFitness(interaction_matrix=np.zeros((2, 2)))
+        expr_matrix = np.array([[1.0, 2.0]])
+        np.testing.assert_allclose(selector.compute_fitness_batch(expr_matrix), [1.5])
+
+        selector.interaction_matrix = np.array([[0.0, 1.0], [1.0, 0.0]])
+        # mean 1.5 + (2 * 1 * 2 * 1.0) / 2 genes
+        np.testing.assert_allclose(selector.compute_fitness_batch(expr_matrix), [3.5])
+
+        with pytest.raises(ValueError):
+            selector.interaction_matrix[0, 0] = 5.0
+        with pytest.raises(ValueError):
+            selector.interaction_matrix = np.zeros((2, 3))
+
 
 class TestMultiObjectiveSelection:
     """Tests for MultiObjectiveSelection model (weighted objectives)."""
@@ -710,3 +895,30 @@ class TestMultiObjectiveSelection:
             1.0,
         ]
         np.testing.assert_allclose(fitness_batch, expected)
+
+    def test_multi_objective_selection_reassigned_weights_are_used(self):
+        """Reassigned objective_weights are used; in-place edits are rejected."""
+        selector = MultiObjectiveSelection(objective_weights=[1.0, 1.0])
+        expr_matrix = np.array([[1.0, 3.0]])
+        np.testing.assert_allclose(selector.compute_fitness_batch(expr_matrix), [2.0])
+
+        selector.objective_weights = [3.0, 1.0]
+        np.testing.assert_allclose(selector.compute_fitness_batch(expr_matrix), [1.5])
+
+        with pytest.raises(ValueError):
+            selector.objective_weights[0] = 0.0
+        with pytest.raises(ValueError):
+            selector.objective_weights = [-1.0, 1.0]
+
+    def test_multi_objective_selection_batch_matches_weighted_mean(self):
+        """Batch fitness equals the weighted mean of each row for a large population."""
+        weights = np.array([3.0, 0.0, 1.5, 0.5])
+        selector = MultiObjectiveSelection(objective_weights=weights)
+
+        rng = np.random.default_rng(7)
+        expr_matrix = rng.uniform(0.0, 2.0, size=(500, 4))
+
+        fitness_batch = selector.compute_fitness_batch(expr_matrix)
+
+        expected = (expr_matrix * weights).sum(axis=1) / weights.sum()
+        np.testing.assert_allclose(fitness_batch, expected, rtol=1e-12)